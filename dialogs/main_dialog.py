@@ -10,12 +10,24 @@ UI uses Cinema 4D's native QUICKTAB interface:
 
 import c4d
 import math
+import os
+import time
+import weakref
 from c4d import gui
 from modules.threading_bridge import EventType, BridgeEvent
 from modules.protocol import FacetShapeType
 
 PLUGIN_ID = 1066929
 
+# Opt-in (PLASTICITY_DEBUG_TIMINGS=1): show the "Print Handler Timings" button
+# on the Utilities tab. It is a diagnostics aid, so hidden by default.
+SHOW_HANDLER_TIMINGS = os.environ.get("PLASTICITY_DEBUG_TIMINGS") == "1"
+
+# Refacet constants (hoisted out of _do_refacet)
+_PI_OVER_4  = math.pi / 4.0
+_SQRT_HALF  = math.sqrt(0.5)
+_SHAPE_CUT  = FacetShapeType.CUT
+
 # Tab indices for the QuickTab
 TAB_SERVER    = 0
 TAB_BASIC     = 1
@@ -67,7 +79,48 @@ class IDS:
 
     # Utilities tab
     LBL_UTILITIES_SOON   = 1900
-
+    BTN_DUMP_LATENCY     = 1901
+
+# Widget ids used by the Command table and the UI refresh, bound as module
+# globals to skip the IDS class attribute lookup
+_QUICKTAB            = IDS.QUICKTAB
+_BTN_CONNECT         = IDS.BTN_CONNECT
+_BTN_DISCONNECT      = IDS.BTN_DISCONNECT
+_BTN_REFRESH         = IDS.BTN_REFRESH
+_CHK_LIVELINK        = IDS.CHK_LIVELINK
+_SLD_UNIT_SCALE      = IDS.SLD_UNIT_SCALE
+_TOGGLE_TOPOLOGY     = IDS.TOGGLE_TOPOLOGY
+_TOGGLE_REFACET_OPTS = IDS.TOGGLE_REFACET_OPTS
+_BTN_REFACET         = IDS.BTN_REFACET
+_LBL_STATUS          = IDS.LBL_STATUS
+_LBL_FILENAME        = IDS.LBL_FILENAME
+
+
+# Refacet slider -> (dialog attribute mirroring its live value, min, max, step)
+_SLIDER_CONFIG = {
+    IDS.SLD_TOLERANCE:       ("_tolerance",         0.0001, 0.1,    0.001),
+    IDS.SLD_ANGLE:           ("_angle",             0.01,   1.57,   0.01),
+    IDS.SLD_MIN_WIDTH:       ("_min_width",         0.0,    10.0,   0.01),
+    IDS.SLD_MAX_WIDTH:       ("_max_width",         0.0,    1000.0, 0.1),
+    IDS.SLD_CURVE_CHORD_TOL: ("_curve_chord_tol",   0.0001, 1.0,    0.001),
+    IDS.SLD_CURVE_CHORD_ANG: ("_curve_chord_angle", 0.01,   1.57,   0.01),
+    IDS.SLD_SURF_PLANE_TOL:  ("_surface_plane_tol", 0.0001, 1.0,    0.001),
+    IDS.SLD_SURF_ANGLE_TOL:  ("_surface_angle_tol", 0.01,   1.57,   0.01),
+}
+_SLIDER_ATTRS = {sid: cfg[0] for sid, cfg in _SLIDER_CONFIG.items()}
+
+_SIMPLE_SLIDER_IDS = (IDS.SLD_TOLERANCE, IDS.SLD_ANGLE)
+
+# Advanced refacet rows: (label, slider id), in display order
+_ADVANCED_SLIDERS = (
+    ("Min Width",        IDS.SLD_MIN_WIDTH),
+    ("Max Width",        IDS.SLD_MAX_WIDTH),
+    ("Edge Chord Tol",   IDS.SLD_CURVE_CHORD_TOL),
+    ("Edge Chord Angle", IDS.SLD_CURVE_CHORD_ANG),
+    ("Face Plane Tol",   IDS.SLD_SURF_PLANE_TOL),
+    ("Face Angle Tol",   IDS.SLD_SURF_ANGLE_TOL),
+)
+_ADVANCED_SLIDER_IDS = tuple(slider_id for _, slider_id in _ADVANCED_SLIDERS)
 
 def _add_section_header(dlg, gadget_id, title):
     """Add a QUICKTAB_BAR section header — the thin titled separator bar."""
@@ -78,8 +131,56 @@ def _add_section_header(dlg, gadget_id, title):
                      c4d.BFH_SCALEFIT, 0, 0, bc)
 
 
+def _add_quicktab(dlg, gadget_id, entries, multiselect=False):
+    """
+    Add a QuickTab custom GUI filled with entries — (label, selected) pairs
+    appended at indices 0, 1, … Returns the gadget (None if it failed).
+    """
+    bc = c4d.BaseContainer()
+    bc.SetBool(c4d.QUICKTAB_BAR, False)
+    bc.SetBool(c4d.QUICKTAB_SHOWSINGLE, True)
+    bc.SetBool(c4d.QUICKTAB_NOMULTISELECT, not multiselect)
+    tab = dlg.AddCustomGui(gadget_id, c4d.CUSTOMGUI_QUICKTAB, "",
+                           c4d.BFH_SCALEFIT | c4d.BFV_FIT, 0, 0, bc)
+    if tab:
+        for index, (label, selected) in enumerate(entries):
+            tab.AppendString(index, label, selected)
+    return tab
+
+
+_STATUS_PREFIX = "Status: "
+_FILE_PREFIX   = "File: "
+
+
+def _post_wakeup():
+    """Bridge wakeup hook — safe to call from any thread."""
+    c4d.SpecialEventAdd(PLUGIN_ID)
+
+
 class PlasticityDialog(gui.GeDialog):
-    TIMER_INTERVAL = 16   # ~60 fps
+    # Bridge activity wakes the dialog through SpecialEventAdd → CoreMessage;
+    # the timer is only a safety net, plus a fast tick for pending debounces.
+    TIMER_INTERVAL      = 16    # ~60 fps while a Unit Scale change is pending
+    TIMER_INTERVAL_IDLE = 500   # safety net
+
+    # Bridge events dispatched per tick; the rest wait for the next wakeup
+    MAX_EVENTS_PER_TICK = 64
+
+    # Quiet period for Unit Scale drags: a value is applied once the slider
+    # has not moved for this many seconds (or at once when the drag ends)
+    UNIT_SCALE_DEBOUNCE = 0.05
+
+    # Bridge event -> name of the main-thread handler method
+    _CALLBACKS = (
+        (EventType.CONNECTED,        "_on_connected"),
+        (EventType.DISCONNECTED,     "_on_disconnected"),
+        (EventType.CONNECTION_ERROR, "_on_connection_error"),
+        (EventType.NEW_VERSION,      "_on_new_version"),
+        (EventType.NEW_FILE,         "_on_new_file"),
+        (EventType.LIST_RESPONSE,    "_on_operation_complete"),
+        (EventType.REFACET_RESPONSE, "_on_operation_complete"),
+        (EventType.STATUS_UPDATE,    "_on_status_update"),
+    )
 
     def __init__(self, client, handler, bridge):
         super().__init__()
@@ -101,22 +202,65 @@ class PlasticityDialog(gui.GeDialog):
         self._surface_plane_tol = 0.01
         self._surface_angle_tol = 0.35
         self._unit_scale        = 1.0
+        self._livelink          = False
+
+        # Unit Scale value waiting to be applied by the Timer (None = nothing)
+        self._pending_unit_scale  = None
+        self._unit_scale_dirty_at = 0.0
         self._busy              = False
 
+        # Interval currently passed to SetTimer() (0 = timer stopped)
+        self._current_timer_ms  = 0
+
+        # Bridge revision last pushed to the widgets; _ui_dirty is set by
+        # callbacks and commands that change dialog-side state (e.g. _busy)
+        self._ui_rev            = -1
+        self._ui_dirty          = True
+
+        # (connected, busy, status, filename) last shown by _update_ui_state
+        self._ui_state          = None
+
+        # Groups whose layout must be recomputed by _flush_layout()
+        self._pending_layout    = set()
+        # Hidden state last written per gadget id by _hide()
+        self._hidden            = {}
+
+        # Last refacet settings key and the kwargs derived from it
+        self._refacet_key       = None
+        self._refacet_kwargs    = None
+
+        # Lazily filled groups (Advanced options, Utilities tab) built so far
+        self._built             = set()
+
         # QuickTab widget references
         self._quicktab          = None
         self._toggle_topology   = None
         self._toggle_refacet    = None
 
-        # Register bridge callbacks
-        bridge.register_callback(EventType.CONNECTED,        self._on_connected)
-        bridge.register_callback(EventType.DISCONNECTED,     self._on_disconnected)
-        bridge.register_callback(EventType.CONNECTION_ERROR, self._on_connection_error)
-        bridge.register_callback(EventType.NEW_VERSION,      self._on_new_version)
-        bridge.register_callback(EventType.NEW_FILE,         self._on_new_file)
-        bridge.register_callback(EventType.LIST_RESPONSE,    self._on_operation_complete)
-        bridge.register_callback(EventType.REFACET_RESPONSE, self._on_operation_complete)
-        bridge.register_callback(EventType.STATUS_UPDATE,    self._on_status_update)
+        # Command() jump table: gadget id -> handler(id, msg)
+        self._commands = {
+            _QUICKTAB:            self._cmd_quicktab,
+            _BTN_CONNECT:         self._cmd_connect,
+            _BTN_DISCONNECT:      self._cmd_disconnect,
+            _BTN_REFRESH:         self._cmd_refresh,
+            _CHK_LIVELINK:        self._cmd_livelink,
+            _SLD_UNIT_SCALE:      self._cmd_unit_scale,
+            _TOGGLE_TOPOLOGY:     self._cmd_topology,
+            _TOGGLE_REFACET_OPTS: self._cmd_refacet_options,
+            _BTN_REFACET:         self._cmd_refacet,
+            IDS.BTN_DUMP_LATENCY: self._cmd_dump_latency,
+        }
+        for slider_id in _SLIDER_ATTRS:
+            self._commands[slider_id] = self._cmd_refacet_slider
+
+        # Wake the main thread as soon as the bridge has work
+        bridge.set_wakeup(_post_wakeup)
+
+        # Register bridge callbacks weakly so the bridge never keeps a closed
+        # dialog alive
+        bridge.register_many(
+            (event_type, weakref.WeakMethod(getattr(self, name)))
+            for event_type, name in self._CALLBACKS)
 
     # =========================================================================
     # Layout
@@ -126,28 +270,34 @@ class PlasticityDialog(gui.GeDialog):
     # (inputs, toggles, buttons) starts at the same x-position throughout.
     LABEL_W = 160
 
+    def _add_label(self, name=""):
+        """Left-column label cell (empty = spacer) of a 2-column grid row."""
+        self.AddStaticText(0, c4d.BFH_LEFT, initw=self.LABEL_W, name=name)
+
+    def _add_slider_row(self, label, slider_id):
+        """Label + edit slider filling one row of the enclosing 2-column grid."""
+        self._add_label(label)
+        self.AddEditSlider(slider_id, c4d.BFH_SCALEFIT)
+
     def CreateLayout(self):
         self.SetTitle("Plasticity Bridge")
         LW = self.LABEL_W
 
+        # Fresh gadgets — forget whatever was written to the previous ones
+        self._ui_state       = None
+        self._hidden.clear()
+        self._built.clear()
+
         if self.GroupBegin(IDS.GRP_MAIN, c4d.BFH_SCALEFIT | c4d.BFV_SCALEFIT,
                            cols=1, rows=0):
             self.GroupBorderSpace(4, 4, 4, 4)
 
             # ── QuickTab bar ─────────────────────────────────────────────
-            bc = c4d.BaseContainer()
-            bc.SetBool(c4d.QUICKTAB_BAR, False)
-            bc.SetBool(c4d.QUICKTAB_SHOWSINGLE, True)
-            bc.SetBool(c4d.QUICKTAB_NOMULTISELECT, False)
-
-            self._quicktab = self.AddCustomGui(
-                IDS.QUICKTAB, c4d.CUSTOMGUI_QUICKTAB, "",
-                c4d.BFH_SCALEFIT | c4d.BFV_FIT, 0, 0, bc)
-
-            if self._quicktab:
-                self._quicktab.AppendString(TAB_SERVER,    "Server",    True)
-                self._quicktab.AppendString(TAB_BASIC,     "Basic",     True)
-                self._quicktab.AppendString(TAB_UTILITIES, "Utilities", False)
+            # Entry order matches TAB_SERVER / TAB_BASIC / TAB_UTILITIES
+            self._quicktab = _add_quicktab(
+                self, IDS.QUICKTAB,
+                (("Server", True), ("Basic", True), ("Utilities", False)),
+                multiselect=True)
 
             # ── Tab: Server ──────────────────────────────────────────────
             if self.GroupBegin(IDS.GRP_TAB_SERVER,
@@ -159,8 +309,7 @@ class PlasticityDialog(gui.GeDialog):
                 if self.GroupBegin(0, c4d.BFH_SCALEFIT, 2, 0):
                     self.GroupSpace(8, 0)
                     self.GroupBorderSpace(4, 4, 4, 4)
-                    self.AddStaticText(0, c4d.BFH_LEFT, initw=LW,
-                                       name="Server")
+                    self._add_label("Server")
                     self.AddEditText(IDS.EDT_SERVER, c4d.BFH_SCALEFIT)
                 self.GroupEnd()
 
@@ -168,7 +317,7 @@ class PlasticityDialog(gui.GeDialog):
                 if self.GroupBegin(0, c4d.BFH_SCALEFIT, 2, 0):
                     self.GroupSpace(8, 0)
                     self.GroupBorderSpace(4, 0, 4, 4)
-                    self.AddStaticText(0, c4d.BFH_LEFT, initw=LW, name="")
+                    self._add_label()
                     if self.GroupBegin(0, c4d.BFH_SCALEFIT, 2, 0):
                         self.AddButton(IDS.BTN_CONNECT, c4d.BFH_SCALEFIT,
                                        name="Connect")
@@ -213,9 +362,7 @@ class PlasticityDialog(gui.GeDialog):
                 if self.GroupBegin(0, c4d.BFH_SCALEFIT, 2, 0):
                     self.GroupSpace(8, 0)
                     self.GroupBorderSpace(4, 2, 4, 4)
-                    self.AddStaticText(0, c4d.BFH_LEFT, initw=LW,
-                                       name="Unit Scale")
-                    self.AddEditSlider(IDS.SLD_UNIT_SCALE, c4d.BFH_SCALEFIT)
+                    self._add_slider_row("Unit Scale", IDS.SLD_UNIT_SCALE)
                 self.GroupEnd()
 
             self.GroupEnd()  # GRP_TAB_SERVER
@@ -230,36 +377,20 @@ class PlasticityDialog(gui.GeDialog):
                 if self.GroupBegin(0, c4d.BFH_SCALEFIT, 2, 0):
                     self.GroupSpace(8, 0)
                     self.GroupBorderSpace(4, 4, 4, 2)
-                    self.AddStaticText(0, c4d.BFH_LEFT, initw=LW,
-                                       name="Topology")
-                    bc_topo = c4d.BaseContainer()
-                    bc_topo.SetBool(c4d.QUICKTAB_BAR, False)
-                    bc_topo.SetBool(c4d.QUICKTAB_SHOWSINGLE, True)
-                    bc_topo.SetBool(c4d.QUICKTAB_NOMULTISELECT, True)
-                    self._toggle_topology = self.AddCustomGui(
-                        IDS.TOGGLE_TOPOLOGY, c4d.CUSTOMGUI_QUICKTAB, "",
-                        c4d.BFH_SCALEFIT | c4d.BFV_FIT, 0, 0, bc_topo)
-                    if self._toggle_topology:
-                        self._toggle_topology.AppendString(0, "Tris",  True)
-                        self._toggle_topology.AppendString(1, "Ngons", False)
+                    self._add_label("Topology")
+                    self._toggle_topology = _add_quicktab(
+                        self, IDS.TOGGLE_TOPOLOGY,
+                        (("Tris", True), ("Ngons", False)))
                 self.GroupEnd()
 
                 # Refacet Options toggle
                 if self.GroupBegin(0, c4d.BFH_SCALEFIT, 2, 0):
                     self.GroupSpace(8, 0)
                     self.GroupBorderSpace(4, 2, 4, 4)
-                    self.AddStaticText(0, c4d.BFH_LEFT, initw=LW,
-                                       name="Refacet Options")
-                    bc_opts = c4d.BaseContainer()
-                    bc_opts.SetBool(c4d.QUICKTAB_BAR, False)
-                    bc_opts.SetBool(c4d.QUICKTAB_SHOWSINGLE, True)
-                    bc_opts.SetBool(c4d.QUICKTAB_NOMULTISELECT, True)
-                    self._toggle_refacet = self.AddCustomGui(
-                        IDS.TOGGLE_REFACET_OPTS, c4d.CUSTOMGUI_QUICKTAB,
-                        "", c4d.BFH_SCALEFIT | c4d.BFV_FIT, 0, 0, bc_opts)
-                    if self._toggle_refacet:
-                        self._toggle_refacet.AppendString(0, "Simple",   True)
-                        self._toggle_refacet.AppendString(1, "Advanced", False)
+                    self._add_label("Refacet Options")
+                    self._toggle_refacet = _add_quicktab(
+                        self, IDS.TOGGLE_REFACET_OPTS,
+                        (("Simple", True), ("Advanced", False)))
                 self.GroupEnd()
 
                 # Simple options group (Tolerance + Angle)
@@ -267,47 +398,16 @@ class PlasticityDialog(gui.GeDialog):
                                    c4d.BFH_SCALEFIT, 2, 0):
                     self.GroupSpace(8, 2)
                     self.GroupBorderSpace(4, 2, 4, 0)
-                    self.AddStaticText(0, c4d.BFH_LEFT, initw=LW,
-                                       name="Tolerance")
-                    self.AddEditSlider(IDS.SLD_TOLERANCE, c4d.BFH_SCALEFIT)
-                    self.AddStaticText(0, c4d.BFH_LEFT, initw=LW,
-                                       name="Angle")
-                    self.AddEditSlider(IDS.SLD_ANGLE, c4d.BFH_SCALEFIT)
+                    self._add_slider_row("Tolerance", IDS.SLD_TOLERANCE)
+                    self._add_slider_row("Angle", IDS.SLD_ANGLE)
                 self.GroupEnd()
 
-                # Advanced options group
+                # Advanced options group — left empty here and filled by
+                # _build_advanced_group() the first time Advanced is chosen
                 if self.GroupBegin(IDS.GRP_ADVANCED_OPTIONS,
                                    c4d.BFH_SCALEFIT, 2, 0):
                     self.GroupSpace(8, 2)
                     self.GroupBorderSpace(4, 2, 4, 0)
-
-                    self.AddStaticText(0, c4d.BFH_LEFT, initw=LW,
-                                       name="Min Width")
-                    self.AddEditSlider(IDS.SLD_MIN_WIDTH, c4d.BFH_SCALEFIT)
-
-                    self.AddStaticText(0, c4d.BFH_LEFT, initw=LW,
-                                       name="Max Width")
-                    self.AddEditSlider(IDS.SLD_MAX_WIDTH, c4d.BFH_SCALEFIT)
-
-                    self.AddStaticText(0, c4d.BFH_LEFT, initw=LW,
-                                       name="Edge Chord Tol")
-                    self.AddEditSlider(IDS.SLD_CURVE_CHORD_TOL,
-                                       c4d.BFH_SCALEFIT)
-
-                    self.AddStaticText(0, c4d.BFH_LEFT, initw=LW,
-                                       name="Edge Chord Angle")
-                    self.AddEditSlider(IDS.SLD_CURVE_CHORD_ANG,
-                                       c4d.BFH_SCALEFIT)
-
-                    self.AddStaticText(0, c4d.BFH_LEFT, initw=LW,
-                                       name="Face Plane Tol")
-                    self.AddEditSlider(IDS.SLD_SURF_PLANE_TOL,
-                                       c4d.BFH_SCALEFIT)
-
-                    self.AddStaticText(0, c4d.BFH_LEFT, initw=LW,
-                                       name="Face Angle Tol")
-                    self.AddEditSlider(IDS.SLD_SURF_ANGLE_TOL,
-                                       c4d.BFH_SCALEFIT)
                 self.GroupEnd()  # GRP_ADVANCED_OPTIONS
 
                 self.AddSeparatorH(c4d.BFH_SCALEFIT)
@@ -316,7 +416,7 @@ class PlasticityDialog(gui.GeDialog):
                 if self.GroupBegin(0, c4d.BFH_SCALEFIT, 2, 0):
                     self.GroupSpace(8, 0)
                     self.GroupBorderSpace(4, 2, 4, 4)
-                    self.AddStaticText(0, c4d.BFH_LEFT, initw=LW, name="")
+                    self._add_label()
                     self.AddButton(IDS.BTN_REFACET, c4d.BFH_SCALEFIT,
                                    name="Refacet Selected")
                 self.GroupEnd()
@@ -324,19 +424,9 @@ class PlasticityDialog(gui.GeDialog):
             self.GroupEnd()  # GRP_TAB_BASIC
 
             # ── Tab: Utilities ───────────────────────────────────────────
-            if self.GroupBegin(IDS.GRP_TAB_UTILITIES,
-                               c4d.BFH_SCALEFIT | c4d.BFV_TOP, 1, 0):
-
-                _add_section_header(self, IDS.HDR_UTILITIES, "Utilities")
-
-                if self.GroupBegin(0, c4d.BFH_SCALEFIT, 1, 0):
-                    self.GroupBorderSpace(4, 12, 4, 12)
-                    self.AddStaticText(
-                        IDS.LBL_UTILITIES_SOON, c4d.BFH_CENTER,
-                        name="Select Face / Mark Edges / Paint Faces"
-                             " — coming soon")
-                self.GroupEnd()
-
+            # Filled by _build_utilities_tab() when the tab is first shown
+            self.GroupBegin(IDS.GRP_TAB_UTILITIES,
+                            c4d.BFH_SCALEFIT | c4d.BFV_TOP, 1, 0)
             self.GroupEnd()  # GRP_TAB_UTILITIES
 
         self.GroupEnd()  # GRP_MAIN
@@ -350,33 +440,10 @@ class PlasticityDialog(gui.GeDialog):
         self.SetString(IDS.EDT_SERVER, self._server)
         self.SetBool(IDS.CHK_ONLY_VISIBLE, self._only_visible)
 
-        # Simple sliders
-        self.SetFloat(IDS.SLD_TOLERANCE, self._tolerance,
-                      min=0.0001, max=0.1, step=0.001,
-                      format=c4d.FORMAT_FLOAT)
-        self.SetFloat(IDS.SLD_ANGLE, self._angle,
-                      min=0.01, max=1.57, step=0.01,
-                      format=c4d.FORMAT_FLOAT)
-
-        # Advanced sliders
-        self.SetFloat(IDS.SLD_MIN_WIDTH, self._min_width,
-                      min=0.0, max=10.0, step=0.01,
-                      format=c4d.FORMAT_FLOAT)
-        self.SetFloat(IDS.SLD_MAX_WIDTH, self._max_width,
-                      min=0.0, max=1000.0, step=0.1,
-                      format=c4d.FORMAT_FLOAT)
-        self.SetFloat(IDS.SLD_CURVE_CHORD_TOL, self._curve_chord_tol,
-                      min=0.0001, max=1.0, step=0.001,
-                      format=c4d.FORMAT_FLOAT)
-        self.SetFloat(IDS.SLD_CURVE_CHORD_ANG, self._curve_chord_angle,
-                      min=0.01, max=1.57, step=0.01,
-                      format=c4d.FORMAT_FLOAT)
-        self.SetFloat(IDS.SLD_SURF_PLANE_TOL, self._surface_plane_tol,
-                      min=0.0001, max=1.0, step=0.001,
-                      format=c4d.FORMAT_FLOAT)
-        self.SetFloat(IDS.SLD_SURF_ANGLE_TOL, self._surface_angle_tol,
-                      min=0.01, max=1.57, step=0.01,
-                      format=c4d.FORMAT_FLOAT)
+        # Refacet sliders (Advanced ones exist only once the group is built)
+        self._init_sliders(_SIMPLE_SLIDER_IDS)
+        if IDS.GRP_ADVANCED_OPTIONS in self._built:
+            self._init_sliders(_ADVANCED_SLIDER_IDS)
 
         # Unit scale
         self.SetFloat(IDS.SLD_UNIT_SCALE, self._unit_scale,
@@ -388,11 +455,59 @@ class PlasticityDialog(gui.GeDialog):
 
         # Apply initial quicktab visibility
         self._sync_tab_visibility()
+        self._flush_layout()
 
         self._update_ui_state()
-        self.SetTimer(self.TIMER_INTERVAL)
+        self._update_timer_interval()
         return True
 
+    def _init_sliders(self, slider_ids):
+        """SetFloat() each refacet slider from its mirrored attribute."""
+        fmt = c4d.FORMAT_FLOAT
+        for slider_id in slider_ids:
+            attr, lo, hi, step = _SLIDER_CONFIG[slider_id]
+            self.SetFloat(slider_id, getattr(self, attr),
+                          min=lo, max=hi, step=step, format=fmt)
+
+    def _build_advanced_group(self):
+        """Create the Advanced refacet sliders inside GRP_ADVANCED_OPTIONS."""
+        self.LayoutFlushGroup(IDS.GRP_ADVANCED_OPTIONS)
+        self.GroupSpace(8, 2)
+        self.GroupBorderSpace(4, 2, 4, 0)
+
+        for label, slider_id in _ADVANCED_SLIDERS:
+            self._add_slider_row(label, slider_id)
+
+        self._built.add(IDS.GRP_ADVANCED_OPTIONS)
+        self._init_sliders(_ADVANCED_SLIDER_IDS)
+        self._pending_layout.add(IDS.GRP_ADVANCED_OPTIONS)
+
+    def _build_utilities_tab(self):
+        """Create the Utilities tab content inside GRP_TAB_UTILITIES."""
+        self.LayoutFlushGroup(IDS.GRP_TAB_UTILITIES)
+
+        _add_section_header(self, IDS.HDR_UTILITIES, "Utilities")
+
+        if self.GroupBegin(0, c4d.BFH_SCALEFIT, 1, 0):
+            self.GroupBorderSpace(4, 12, 4, 12)
+            self.AddStaticText(
+                IDS.LBL_UTILITIES_SOON, c4d.BFH_CENTER,
+                name="Select Face / Mark Edges / Paint Faces"
+                     " — coming soon")
+        self.GroupEnd()
+
+        if SHOW_HANDLER_TIMINGS:
+            if self.GroupBegin(0, c4d.BFH_SCALEFIT, 2, 0):
+                self.GroupSpace(8, 0)
+                self.GroupBorderSpace(4, 2, 4, 4)
+                self._add_label()
+                self.AddButton(IDS.BTN_DUMP_LATENCY, c4d.BFH_SCALEFIT,
+                               name="Print Handler Timings")
+            self.GroupEnd()
+
+        self._built.add(IDS.GRP_TAB_UTILITIES)
+        self._pending_layout.add(IDS.GRP_TAB_UTILITIES)
+
     # =========================================================================
     # QuickTab visibility sync
     # =========================================================================
@@ -406,107 +521,239 @@ class PlasticityDialog(gui.GeDialog):
         show_basic     = self._quicktab.IsSelected(TAB_BASIC)
         show_utilities = self._quicktab.IsSelected(TAB_UTILITIES)
 
-        self.HideElement(IDS.GRP_TAB_SERVER,    not show_server)
-        self.HideElement(IDS.GRP_TAB_BASIC,     not show_basic)
-        self.HideElement(IDS.GRP_TAB_UTILITIES, not show_utilities)
+        if show_utilities and IDS.GRP_TAB_UTILITIES not in self._built:
+            self._build_utilities_tab()
 
-        self.LayoutChanged(IDS.GRP_MAIN)
+        self._hide(IDS.GRP_TAB_SERVER,    not show_server,    IDS.GRP_MAIN)
+        self._hide(IDS.GRP_TAB_BASIC,     not show_basic,     IDS.GRP_MAIN)
+        self._hide(IDS.GRP_TAB_UTILITIES, not show_utilities, IDS.GRP_MAIN)
 
     def _sync_refacet_options(self):
         """Show Simple or Advanced options based on the Refacet Options toggle."""
         if self._toggle_refacet:
             self._advanced_mode = self._toggle_refacet.IsSelected(1)
-        self.HideElement(IDS.GRP_SIMPLE_OPTIONS,   self._advanced_mode)
-        self.HideElement(IDS.GRP_ADVANCED_OPTIONS,  not self._advanced_mode)
-        self.LayoutChanged(IDS.GRP_TAB_BASIC)
+        if (self._advanced_mode
+                and IDS.GRP_ADVANCED_OPTIONS not in self._built):
+            self._build_advanced_group()
+        self._hide(IDS.GRP_SIMPLE_OPTIONS,   self._advanced_mode,
+                   IDS.GRP_TAB_BASIC)
+        self._hide(IDS.GRP_ADVANCED_OPTIONS, not self._advanced_mode,
+                   IDS.GRP_TAB_BASIC)
+
+    def _hide(self, gadget_id, hidden, layout_group):
+        """
+        HideElement() and queue one LayoutChanged() for the parent group —
+        both skipped when the element is already in the requested state.
+        """
+        if self._hidden.get(gadget_id) == hidden:
+            return
+        self._hidden[gadget_id] = hidden
+        self.HideElement(gadget_id, hidden)
+        self._pending_layout.add(layout_group)
+
+    def _flush_layout(self):
+        """Run a single LayoutChanged() per group touched since the last flush."""
+        for group_id in self._pending_layout:
+            self.LayoutChanged(group_id)
+        self._pending_layout.clear()
 
     # =========================================================================
-    # Timer
+    # Timer / bridge wakeup
     # =========================================================================
 
     def Timer(self, msg):
-        self.bridge.process_pending_events()
-        self._update_ui_state()
+        self._pump()
+
+    def CoreMessage(self, id, msg):
+        if id == PLUGIN_ID:
+            self._pump()
+        return super().CoreMessage(id, msg)
+
+    def _pump(self):
+        """Drain bridge events and refresh the widgets (main thread)."""
+        t0 = time.perf_counter_ns()
+        self.bridge.consume_wakeup()
+
+        # Callbacks touch the C4D API, so they must be dispatched here on the
+        # main thread; parsing already happened on the WebSocket thread.
+        # The drain is capped per tick so a burst cannot stall the UI; if the
+        # cap was hit, post another wakeup for the remainder.
+        if self.bridge.has_pending():
+            max_events = self.MAX_EVENTS_PER_TICK
+            if self.bridge.process_pending_events(max_events) >= max_events:
+                _post_wakeup()
+
+        if (self._pending_unit_scale is not None
+                and time.monotonic() - self._unit_scale_dirty_at
+                >= self.UNIT_SCALE_DEBOUNCE):
+            self._flush_unit_scale()
+
+        self._refresh_ui()
+
+        self._update_timer_interval()
+        self.bridge.latency.push("tick", time.perf_counter_ns() - t0)
+
+    def _refresh_ui(self):
+        """One _update_ui_state() for everything that changed since the last."""
+        if not self.IsVisible():
+            # Panel collapsed or on another layout: the scene still follows
+            # Live Link above, but widgets are left alone and fully refreshed
+            # on the first visible tick.
+            self._ui_rev = -1
+            return
+        # Only touch the widgets when bridge or dialog state actually changed
+        rev = self.bridge.revision
+        if rev != self._ui_rev or self._ui_dirty:
+            self._ui_rev   = rev
+            self._ui_dirty = False
+            self._update_ui_state()
+
+    def _update_timer_interval(self):
+        """Tick fast only while a debounce is pending; idle slowly otherwise."""
+        if self._pending_unit_scale is not None:
+            desired = self.TIMER_INTERVAL
+        else:
+            desired = self.TIMER_INTERVAL_IDLE
+        if desired != self._current_timer_ms:
+            self.SetTimer(desired)
+            self._current_timer_ms = desired
 
     # =========================================================================
     # Commands
     # =========================================================================
 
     def Command(self, id, msg):
-        # ── QuickTab toggled ─────────────────────────────────────────────
-        if id == IDS.QUICKTAB:
-            self._sync_tab_visibility()
+        handler = self._commands.get(id)
+        if handler is None:
             return True
+        t0 = time.perf_counter_ns()
+        handler(id, msg)
+        self._ui_dirty = True
+        self._refresh_ui()
+        self._flush_layout()
+        self._update_timer_interval()
+        self.bridge.latency.push(handler.__name__,
+                                 time.perf_counter_ns() - t0)
+        return True
 
-        # ── Connection ───────────────────────────────────────────────────
-        if id == IDS.BTN_CONNECT:
-            if self._busy:
-                return True
-            self._server = self.GetString(IDS.EDT_SERVER)
-            self.client.connect(self._server)
+    # ── QuickTab toggled ─────────────────────────────────────────────────
 
-        elif id == IDS.BTN_DISCONNECT:
-            self.client.disconnect()
+    def _cmd_quicktab(self, id, msg):
+        self._sync_tab_visibility()
 
-        # ── Refresh ──────────────────────────────────────────────────────
-        elif id == IDS.BTN_REFRESH:
-            if self._busy:
-                return True
-            self._busy = True
-            self._only_visible = self.GetBool(IDS.CHK_ONLY_VISIBLE)
-            if self._only_visible:
-                self.client.list_visible()
-            else:
-                self.client.list_all()
-
-        # ── Live Link ────────────────────────────────────────────────────
-        elif id == IDS.CHK_LIVELINK:
-            if self.GetBool(IDS.CHK_LIVELINK):
-                self.client.subscribe_all()
-            else:
-                self.client.unsubscribe()
-
-        # ── Unit Scale ───────────────────────────────────────────────────
-        elif id == IDS.SLD_UNIT_SCALE:
-            self._unit_scale = self.GetFloat(IDS.SLD_UNIT_SCALE)
-            self.handler.update_unit_scale(self._unit_scale)
-
-        # ── Topology toggle ───────────────────────────────────────────
-        elif id == IDS.TOGGLE_TOPOLOGY:
-            if self._toggle_topology:
-                self._tri_mode = self._toggle_topology.IsSelected(0)
-
-        # ── Refacet Options toggle ───────────────────────────────────
-        elif id == IDS.TOGGLE_REFACET_OPTS:
-            self._sync_refacet_options()
-
-        # ── Refacet ──────────────────────────────────────────────────────
-        elif id == IDS.BTN_REFACET:
-            if self._busy:
-                return True
-            self._busy = True
-            self._do_refacet()
+    # ── Connection ───────────────────────────────────────────────────────
 
-        return True
+    def _cmd_connect(self, id, msg):
+        if self._busy:
+            return
+        self._server = self.GetString(IDS.EDT_SERVER)
+        # Same worker as disconnect(): jobs run in submission order, so a
+        # Connect right after a Disconnect starts only once it has finished
+        self.bridge.submit(self.client.connect, self._server)
+
+    def _cmd_disconnect(self, id, msg):
+        # disconnect() joins the socket thread — keep that off the UI
+        self.bridge.submit(self.client.disconnect)
+
+    # ── Refresh ──────────────────────────────────────────────────────────
+
+    def _cmd_refresh(self, id, msg):
+        if self._busy:
+            return
+        self._busy = True
+        self._only_visible = self.GetBool(IDS.CHK_ONLY_VISIBLE)
+        # Sends wait for the socket; the LIST_RESPONSE (or a STATUS_UPDATE
+        # on failure) clears _busy on the main thread.
+        if self._only_visible:
+            self.bridge.submit(self.client.list_visible)
+        else:
+            self.bridge.submit(self.client.list_all)
+
+    # ── Live Link ────────────────────────────────────────────────────────
+
+    def _cmd_livelink(self, id, msg):
+        self._livelink = self.GetBool(_CHK_LIVELINK)
+        if self._livelink:
+            self.bridge.submit(self.client.subscribe_all)
+        else:
+            self.bridge.submit(self.client.unsubscribe)
+
+    # ── Unit Scale (applied from Timer, see _flush_unit_scale) ───────────
+
+    def _cmd_unit_scale(self, id, msg):
+        scale = self.GetFloat(_SLD_UNIT_SCALE)
+        if scale == self._unit_scale:
+            self._pending_unit_scale = None
+            return
+        self._pending_unit_scale  = scale
+        self._unit_scale_dirty_at = time.monotonic()
+        # Typed values, arrow steps and the drag release apply at once
+        if not msg.GetBool(c4d.BFM_ACTION_INDRAG):
+            self._flush_unit_scale()
+
+    # ── Refacet sliders (mirrored so _do_refacet needs no GetFloat) ──────
+
+    def _cmd_refacet_slider(self, id, msg):
+        setattr(self, _SLIDER_ATTRS[id], self.GetFloat(id))
+
+    # ── Topology / Refacet Options toggles ───────────────────────────────
+
+    def _cmd_topology(self, id, msg):
+        if self._toggle_topology:
+            self._tri_mode = self._toggle_topology.IsSelected(0)
+
+    def _cmd_refacet_options(self, id, msg):
+        self._sync_refacet_options()
+
+    # ── Refacet ──────────────────────────────────────────────────────────
+
+    def _cmd_refacet(self, id, msg):
+        if self._busy:
+            return
+        self._busy = True
+        self._do_refacet()
+
+    # ── Utilities ────────────────────────────────────────────────────────
+
+    def _cmd_dump_latency(self, id, msg):
+        # format_summary() lines carry the usual "[Plasticity]" console prefix
+        print(self.bridge.latency.format_summary())
+        self.bridge.status_message = "Handler timings printed to the console"
+
+    def _flush_unit_scale(self):
+        """Apply a debounced Unit Scale change to the scene."""
+        scale = self._pending_unit_scale
+        self._pending_unit_scale = None
+        if scale is not None and scale != self._unit_scale:
+            self._unit_scale = scale
+            self.handler.update_unit_scale(scale)
 
     # =========================================================================
     # UI state
     # =========================================================================
 
     def _update_ui_state(self):
-        connected = self.bridge.connected
+        connected, status, filename = self.bridge.snapshot()
+        busy     = self._busy
+        filename = filename or "-"
+
+        # Nothing to write unless something shown has changed
+        state = (connected, busy, status, filename)
+        if state == self._ui_state:
+            return
+        self._ui_state = state
+
+        idle = connected and not busy
 
-        self.Enable(IDS.BTN_CONNECT,    not connected and not self._busy)
+        self.Enable(IDS.BTN_CONNECT,    not connected and not busy)
         self.Enable(IDS.BTN_DISCONNECT, connected)
-        self.Enable(IDS.BTN_REFRESH,    connected and not self._busy)
+        self.Enable(IDS.BTN_REFRESH,    idle)
         self.Enable(IDS.CHK_LIVELINK,   connected)
-        self.Enable(IDS.BTN_REFACET,    connected and not self._busy)
+        self.Enable(IDS.BTN_REFACET,    idle)
         self.Enable(IDS.EDT_SERVER,     not connected)
 
-        status = self.bridge.status_message
-        self.SetString(IDS.LBL_STATUS,   f"Status: {status}")
-        filename = self.bridge.filename or "-"
-        self.SetString(IDS.LBL_FILENAME, f"File: {filename}")
+        self.SetString(_LBL_STATUS,   _STATUS_PREFIX + status)
+        self.SetString(_LBL_FILENAME, _FILE_PREFIX + filename)
 
     # =========================================================================
     # Bridge event callbacks
@@ -514,21 +761,27 @@ class PlasticityDialog(gui.GeDialog):
 
     def _on_connected(self, event: BridgeEvent):
         self._busy = False
+        self._ui_dirty = True
 
     def _on_disconnected(self, event: BridgeEvent):
         self._busy = False
+        self._ui_dirty = True
+        self._livelink = False
         self.SetBool(IDS.CHK_LIVELINK, False)
 
     def _on_connection_error(self, event: BridgeEvent):
         self._busy = False
+        self._ui_dirty = True
         error = event.error_message or "Unknown error"
         gui.MessageDialog(f"Connection error:\n{error}")
 
     def _on_operation_complete(self, event: BridgeEvent):
         self._busy = False
+        self._ui_dirty = True
 
     def _on_status_update(self, event: BridgeEvent):
         self._busy = False
+        self._ui_dirty = True
 
     def _on_new_version(self, event: BridgeEvent):
         pass
@@ -546,54 +799,68 @@ class PlasticityDialog(gui.GeDialog):
             self._busy = False
             return
 
-        ids = self.handler.get_selected_plasticity_ids(doc)
-        if not ids:
+        by_filename = self.handler.get_selected_plasticity_ids_by_file(doc)
+        if not by_filename:
             gui.MessageDialog(
                 "No Plasticity objects selected.\n"
                 "Select one or more Plasticity mesh objects first.")
             self._busy = False
             return
 
-        by_filename = {}
-        for filename, obj_id in ids:
-            by_filename.setdefault(filename, []).append(obj_id)
+        params = self._refacet_params()
 
-        tolerance = self.GetFloat(IDS.SLD_TOLERANCE)
-        angle     = self.GetFloat(IDS.SLD_ANGLE)
-        min_width = self.GetFloat(IDS.SLD_MIN_WIDTH)
-        max_width = self.GetFloat(IDS.SLD_MAX_WIDTH)
+        # Selection is read above on the main thread; the sends themselves
+        # block on the network, so they run on the bridge worker.
+        self.bridge.submit(self._refacet_worker, by_filename, params)
 
-        max_sides       = 3   if self._tri_mode else 128
-        plane_angle     = 0.0 if self._tri_mode else math.pi / 4.0
-        curve_chord_max = max_width * math.sqrt(0.5)
+    def _refacet_params(self):
+        """Refacet kwargs for the current settings, rebuilt only on change."""
+        tri_mode  = self._tri_mode
+        tolerance = self._tolerance
+        angle     = self._angle
+        min_width = self._min_width
+        max_width = self._max_width
 
         if self._advanced_mode:
-            cct = self.GetFloat(IDS.SLD_CURVE_CHORD_TOL)
-            cca = self.GetFloat(IDS.SLD_CURVE_CHORD_ANG)
-            spt = self.GetFloat(IDS.SLD_SURF_PLANE_TOL)
-            spa = self.GetFloat(IDS.SLD_SURF_ANGLE_TOL)
+            cct = self._curve_chord_tol
+            cca = self._curve_chord_angle
+            spt = self._surface_plane_tol
+            spa = self._surface_angle_tol
         else:
             cct = tolerance
             cca = angle
             spt = tolerance
             spa = angle
 
+        key = (tri_mode, min_width, max_width, cct, cca, spt, spa)
+        if key == self._refacet_key:
+            return self._refacet_kwargs
+
+        # Read-only once built: the worker only unpacks it
+        self._refacet_key    = key
+        self._refacet_kwargs = dict(
+            relative_to_bbox        = True,
+            curve_chord_tolerance   = cct,
+            curve_chord_angle       = cca,
+            surface_plane_tolerance = spt,
+            surface_plane_angle     = spa,
+            match_topology          = True,
+            max_sides               = 3   if tri_mode else 128,
+            plane_angle             = 0.0 if tri_mode else _PI_OVER_4,
+            min_width               = min_width,
+            max_width               = max_width,
+            curve_chord_max         = max_width * _SQRT_HALF,
+            shape                   = _SHAPE_CUT,
+        )
+        return self._refacet_kwargs
+
+    def _refacet_worker(self, by_filename, params):
+        """Send one refacet request per file.  Runs on the bridge worker."""
         for filename, obj_ids in by_filename.items():
             self.client.refacet_some(
-                filename              = filename,
-                plasticity_ids        = obj_ids,
-                relative_to_bbox      = True,
-                curve_chord_tolerance = cct,
-                curve_chord_angle     = cca,
-                surface_plane_tolerance = spt,
-                surface_plane_angle   = spa,
-                match_topology        = True,
-                max_sides             = max_sides,
-                plane_angle           = plane_angle,
-                min_width             = min_width,
-                max_width             = max_width,
-                curve_chord_max       = curve_chord_max,
-                shape                 = FacetShapeType.CUT,
+                filename       = filename,
+                plasticity_ids = obj_ids,
+                **params,
             )
 
     # =========================================================================
@@ -601,10 +868,13 @@ class PlasticityDialog(gui.GeDialog):
     # =========================================================================
 
     def RestoreLayout(self, pluginid, secret):
+        self._ui_rev = -1   # redraw everything on the first visible tick
         return self.Restore(pluginid=pluginid, secret=secret)
 
     def DestroyWindow(self):
         self.SetTimer(0)
+        self._current_timer_ms = 0
+        self._flush_unit_scale()
         if self.bridge.connected:
             self.client.disconnect()
         return super().DestroyWindow()
\ No newline at end of file
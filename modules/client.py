@@ -7,11 +7,12 @@ Architecture matches the Blender addon: only the listen loop calls recv().
 """
 
 import asyncio
+import os
+import sys
 import threading
 import struct
-import weakref
 from typing import Optional, List
-from concurrent.futures import Future
+from concurrent.futures import Future, ThreadPoolExecutor
 
 try:
     import websockets.client as ws_client
@@ -21,8 +22,15 @@ except ImportError:
     WEBSOCKETS_AVAILABLE = False
     print("[Plasticity] Warning: websockets library not found")
 
+# uvloop is optional (not bundled with C4D); use it when it is importable
+try:
+    import uvloop
+    _new_event_loop = uvloop.new_event_loop
+except ImportError:
+    _new_event_loop = asyncio.new_event_loop
+
 from modules.protocol import (
-    MessageType, MessageParser, FacetShapeType,
+    MessageType, MessageParser, ParsedMessage, FacetShapeType,
     encode_list_all, encode_list_visible, encode_subscribe_all,
     encode_subscribe_some, encode_unsubscribe, encode_refacet_some,
 )
@@ -31,6 +39,46 @@ from modules.threading_bridge import (
 )
 
 MAX_SIZE = 2 ** 32 - 1
+# Frames buffered by websockets ahead of the listen loop (default 32); kept
+# bounded because mesh frames can be many MB each
+MAX_QUEUE = 64
+# High-water marks of the incoming / outgoing byte buffers (websockets
+# default 64 KiB); multi-MB mesh frames move in far fewer, larger chunks
+READ_LIMIT = 2 ** 20
+WRITE_LIMIT = 2 ** 20
+# Frames per parse batch, and how long one listen pass may keep draining
+BATCH_MAX_FRAMES = 16
+BATCH_MAX_SECONDS = 0.001
+# Opt-in (PLASTICITY_PIN_THREAD=1): pin the listen thread to the last core on
+# Linux / raise its priority on Windows. Off by default — C4D schedules its
+# own worker threads and an unconditional pin can hurt more than it helps.
+PIN_LISTEN_THREAD = os.environ.get("PLASTICITY_PIN_THREAD") == "1"
+
+# Message type -> (bridge event, whether the message carries the filename)
+_EVENT_MAP = {
+    MessageType.LIST_ALL_1:     (EventType.LIST_RESPONSE,    True),
+    MessageType.LIST_SOME_1:    (EventType.LIST_RESPONSE,    True),
+    MessageType.LIST_VISIBLE_1: (EventType.LIST_RESPONSE,    True),
+    MessageType.TRANSACTION_1:  (EventType.TRANSACTION,      True),
+    MessageType.REFACET_SOME_1: (EventType.REFACET_RESPONSE, False),
+    MessageType.NEW_VERSION_1:  (EventType.NEW_VERSION,      True),
+    MessageType.NEW_FILE_1:     (EventType.NEW_FILE,         True),
+}
+
+
+def _tune_listen_thread():
+    """Best-effort affinity/priority tweak for the calling thread."""
+    try:
+        if sys.platform.startswith("linux"):
+            # pid 0 = the calling thread on Linux
+            os.sched_setaffinity(0, {(os.cpu_count() or 1) - 1})
+        elif sys.platform == "win32":
+            import ctypes
+            kernel32 = ctypes.windll.kernel32
+            kernel32.SetThreadPriority(kernel32.GetCurrentThread(),
+                                       1)  # THREAD_PRIORITY_ABOVE_NORMAL
+    except Exception as e:
+        print(f"[Plasticity] Could not tune listen thread: {e}")
 
 
 class PlasticityClient:
@@ -56,6 +104,13 @@ class PlasticityClient:
         self._thread: Optional[threading.Thread] = None
         self._running = False
         self._parser = MessageParser()
+        # Single worker so batches are parsed and pushed in arrival order
+        self._parse_executor: Optional[ThreadPoolExecutor] = None
+        # (message, Future) pairs for the writer task; lives on the loop
+        self._send_queue: Optional[asyncio.Queue] = None
+        # ws.close() started by disconnect(); kept so it is not collected
+        # mid-run and is awaited by the listen loop's teardown
+        self._close_task: Optional[asyncio.Task] = None
 
     @property
     def connected(self) -> bool:
@@ -72,12 +127,20 @@ class PlasticityClient:
         if self.connected:
             self.status.warning("Already connected")
             return
+        old = self._thread
+        if old is not None and old.is_alive():
+            # Its finally block would reset the new connection's state, so
+            # give a slow close the same grace period disconnect() does
+            old.join(timeout=3.0)
+            if old.is_alive():
+                self.status.warning("Previous connection is still closing")
+                return
 
         if server:
             self.server = server
 
         self.status.info(f"Connecting to {self.server}...")
-        self._loop = asyncio.new_event_loop()
+        self._loop = _new_event_loop()
         self._running = True
 
         self._thread = threading.Thread(target=self._run_event_loop, daemon=True)
@@ -90,25 +153,31 @@ class PlasticityClient:
         self.status.info("Disconnecting...")
         self._running = False
 
-        # Ask the websocket to close so recv() raises ConnectionClosed
-        if self._loop and self.websocket:
+        # Start the close handshake on the loop without waiting for it; once
+        # it completes the pending recv() raises ConnectionClosed and the
+        # background thread winds down (joined below). The connection's
+        # handles are captured up front and only they are cleaned up.
+        thread, loop, ws = self._thread, self._loop, self.websocket
+        if loop and ws:
             try:
-                future = asyncio.run_coroutine_threadsafe(
-                    self._disconnect_async(), self._loop
-                )
-                try:
-                    future.result(timeout=2.0)
-                except Exception:
-                    pass
-            except Exception as e:
+                loop.call_soon_threadsafe(self._start_close, ws)
+            except RuntimeError as e:   # loop already closed
                 print(f"[Plasticity] Disconnect error: {e}")
 
         # Wait for the background thread to finish and push DISCONNECTED
-        if self._thread and self._thread.is_alive():
-            self._thread.join(timeout=3.0)
-
-        # Safety net: if the thread didn't clean up, do it from here
-        if self.bridge.connected:
+        if thread and thread.is_alive():
+            thread.join(timeout=3.0)
+
+        # Safety net: if the thread didn't clean up, do it from here — unless
+        # a newer connection has started since. The send queue belongs to the
+        # loop (asyncio.Queue is not thread-safe), so if the loop is still
+        # running its pending sends are failed there.
+        if self._thread is thread and self.bridge.connected:
+            if loop is not None:
+                try:
+                    loop.call_soon_threadsafe(self._fail_queued_sends)
+                except RuntimeError:   # loop closed; its thread already did it
+                    pass
             self._cleanup_state()
             self.bridge.push_event(BridgeEvent(event_type=EventType.DISCONNECTED))
             self.status.info("Disconnected")
@@ -119,8 +188,23 @@ class PlasticityClient:
         self.filename = None
         self.subscribed = False
 
+    def _fail_queued_sends(self):
+        """
+        Fail sends still waiting in the writer queue so callers stop waiting.
+        Loop thread only.
+        """
+        queue, self._send_queue = self._send_queue, None
+        while queue is not None and not queue.empty():
+            _, done = queue.get_nowait()
+            if not done.done():
+                done.set_exception(ConnectionError("Connection closed"))
+
     def _run_event_loop(self):
         asyncio.set_event_loop(self._loop)
+        if PIN_LISTEN_THREAD:
+            _tune_listen_thread()
+        self._parse_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="PlasticityParse")
         try:
             self._loop.run_until_complete(self._connect_and_listen())
         except Exception as e:
@@ -129,6 +213,10 @@ class PlasticityClient:
                 event_type=EventType.CONNECTION_ERROR, error_message=str(e)
             ))
         finally:
+            # Let in-flight parses push their events before DISCONNECTED
+            self._parse_executor.shutdown(wait=True)
+            self._parse_executor = None
+            self._fail_queued_sends()
             try:
                 self._loop.close()
             except Exception:
@@ -141,25 +229,60 @@ class PlasticityClient:
     async def _connect_and_listen(self):
         uri = f"ws://{self.server}"
         try:
-            async with ws_client.connect(uri, max_size=MAX_SIZE) as ws:
-                self.websocket = weakref.proxy(ws)
-                self.bridge.connected = True
+            async with ws_client.connect(
+                    uri, max_size=MAX_SIZE, max_queue=MAX_QUEUE,
+                    read_limit=READ_LIMIT, write_limit=WRITE_LIMIT,
+                    # Local connection: no keepalive ping timer on the loop
+                    ping_interval=None,
+                    # Mesh payloads are dense binary; deflate only costs CPU
+                    compression=None) as ws:
+                self.websocket = ws
                 self.message_id = 0
+                self._send_queue = asyncio.Queue()
+                writer = asyncio.ensure_future(
+                    self._writer(ws, self._send_queue))
+                self.bridge.connected = True
                 self.bridge.push_event(BridgeEvent(event_type=EventType.CONNECTED))
                 self.status.info(f"Connected to {self.server}")
                 # Fix #1: on_connect is triggered by the CONNECTED event callback
                 # on the main thread — not called directly here.
 
-                while self._running:
-                    try:
-                        message = await ws.recv()
-                        await self._handle_message(message)
-                    except ConnectionClosed:
-                        print("[Plasticity] Connection closed by server")
-                        break
-                    except Exception as e:
-                        print(f"[Plasticity] Listen error: {e}")
-                        continue
+                try:
+                    # Batch N is parsed on the parse worker while batch N+1 is
+                    # received here; at most one batch is in flight.
+                    parsing = None
+                    loop = asyncio.get_running_loop()
+                    while self._running:
+                        try:
+                            batch = [await ws.recv()]
+                            # Frames already queued by the protocol are
+                            # drained in the same pass (recv() returns them
+                            # without suspending), up to a size/time cap so
+                            # the first frame's events are not held back
+                            deadline = loop.time() + BATCH_MAX_SECONDS
+                            while (ws.messages
+                                   and len(batch) < BATCH_MAX_FRAMES
+                                   and loop.time() < deadline):
+                                batch.append(await ws.recv())
+                        except ConnectionClosed:
+                            print("[Plasticity] Connection closed by server")
+                            break
+                        except Exception as e:
+                            print(f"[Plasticity] Listen error: {e}")
+                            continue
+                        if parsing is not None:
+                            await asyncio.wrap_future(parsing)
+                        parsing = self._parse_executor.submit(
+                            self._handle_messages, batch)
+                finally:
+                    writer.cancel()
+                    # Reap the task so closing the loop doesn't warn that it
+                    # was destroyed while pending
+                    await asyncio.gather(writer, return_exceptions=True)
+                    close, self._close_task = self._close_task, None
+                    if close is not None:
+                        await asyncio.gather(close, return_exceptions=True)
+                    self.websocket = None
 
         except ConnectionClosed:
             self.status.info("Disconnected from server")
@@ -176,99 +299,118 @@ class PlasticityClient:
                 error_message=str(e)
             ))
 
-    async def _disconnect_async(self):
-        if self.websocket:
-            try:
-                await self.websocket.close()
-            except Exception:
-                pass
-        self._running = False
+    def _start_close(self, ws):
+        """Runs on the loop: begin closing ws in the background."""
+        self._close_task = asyncio.ensure_future(ws.close())
 
     # =========================================================================
     # Message handling
     # =========================================================================
 
-    async def _handle_message(self, data: bytes):
-        try:
-            parsed = self._parser.parse_message(data)
-            if parsed:
-                self._dispatch_parsed(parsed)
-        except Exception as e:
-            print(f"[Plasticity] Parse error: {e}")
-            import traceback
-            traceback.print_exc()
-
-    def _dispatch_parsed(self, parsed: dict):
-        msg_type = parsed.get('type')
-
-        if msg_type in (MessageType.LIST_ALL_1, MessageType.LIST_SOME_1,
-                        MessageType.LIST_VISIBLE_1):
-            fn = parsed.get('filename', '')
-            self.filename = fn
-            self.bridge.filename = fn
-            self.bridge.push_event(BridgeEvent(
-                event_type=EventType.LIST_RESPONSE, data=parsed
-            ))
-
-        elif msg_type == MessageType.TRANSACTION_1:
-            fn = parsed.get('filename', '')
-            self.filename = fn
-            self.bridge.filename = fn
-            self.bridge.push_event(BridgeEvent(
-                event_type=EventType.TRANSACTION, data=parsed
-            ))
-
-        elif msg_type == MessageType.REFACET_SOME_1:
-            self.bridge.push_event(BridgeEvent(
-                event_type=EventType.REFACET_RESPONSE, data=parsed
-            ))
-
-        elif msg_type == MessageType.NEW_VERSION_1:
-            fn = parsed.get('filename', '')
-            self.filename = fn
-            self.bridge.filename = fn
-            self.bridge.push_event(BridgeEvent(
-                event_type=EventType.NEW_VERSION, data=parsed
-            ))
-
-        elif msg_type == MessageType.NEW_FILE_1:
-            fn = parsed.get('filename', '')
+    def _handle_messages(self, batch: List[bytes]):
+        """
+        Parse a batch of frames and hand the resulting events over at once.
+        Runs on the parse worker thread.
+        """
+        events = []
+        for data in batch:
+            # The protocol is binary-only; websockets hands BINARY frames over
+            # as bytes untouched (UTF-8 decoding only happens for TEXT frames)
+            if not isinstance(data, bytes):
+                print("[Plasticity] Ignoring unexpected text frame")
+                continue
+            try:
+                parsed = self._parser.parse_message(data)
+                if parsed:
+                    event = self._dispatch_parsed(parsed)
+                    if event is not None:
+                        events.append(event)
+            except Exception as e:
+                print(f"[Plasticity] Parse error: {e}")
+                import traceback
+                traceback.print_exc()
+        if events:
+            self.bridge.push_events(events)
+
+    def _dispatch_parsed(self, parsed: ParsedMessage) -> Optional[BridgeEvent]:
+        entry = _EVENT_MAP.get(parsed.type)
+        if entry is None:
+            return None
+        event_type, has_filename = entry
+        if has_filename:
+            fn = parsed.filename
             self.filename = fn
             self.bridge.filename = fn
-            self.bridge.push_event(BridgeEvent(
-                event_type=EventType.NEW_FILE, data=parsed
-            ))
+        return BridgeEvent(event_type=event_type, data=parsed)
 
     # =========================================================================
-    # Async send helper
+    # Send queue
     # =========================================================================
 
-    def _run_async(self, coro) -> Optional[Future]:
-        if not self._loop or not self.connected:
+    async def _writer(self, ws, queue: asyncio.Queue):
+        """
+        Single writer for the connection. Every message queued since the last
+        wakeup is written in one pass; each stays its own WebSocket message.
+        """
+        while True:
+            batch = [await queue.get()]
+            while not queue.empty():
+                batch.append(queue.get_nowait())
+            try:
+                for msg, done in batch:
+                    try:
+                        await ws.send(msg)
+                    except Exception as e:
+                        if not done.done():
+                            done.set_exception(e)
+                    else:
+                        if not done.done():
+                            done.set_result(None)
+            finally:
+                # Cancelled mid-batch: release whoever is still waiting
+                for _, done in batch:
+                    if not done.done():
+                        done.set_exception(ConnectionError("Connection closed"))
+
+    def _enqueue(self, msg: bytes) -> Optional[Future]:
+        """Queue msg for the writer task from any thread; None if not connected."""
+        loop, queue = self._loop, self._send_queue
+        if not loop or queue is None or not self.connected:
             return None
+        done = Future()
         try:
-            return asyncio.run_coroutine_threadsafe(coro, self._loop)
-        except Exception:
+            loop.call_soon_threadsafe(queue.put_nowait, (msg, done))
+        except RuntimeError:   # loop already closed
             return None
-
-    def _send_and_wait(self, coro, timeout=5.0):
-        future = self._run_async(coro)
+        return done
+
+    def _send(self, msg: bytes):
+        """
+        Queue msg and return at once. A failed write is reported through a
+        STATUS_UPDATE event (which also clears the dialog's busy state).
+        """
+        future = self._enqueue(msg)
         if future:
-            try:
-                future.result(timeout=timeout)
-            except Exception as e:
-                print(f"[Plasticity] Send failed: {e}")
-                self.status.error(f"Send failed: {e}")
-                self.bridge.push_event(BridgeEvent(
-                    event_type=EventType.STATUS_UPDATE,
-                    error_message=str(e),
-                ))
+            future.add_done_callback(self._on_send_done)
         else:
-            self.status.error("Cannot send — not connected")
-            self.bridge.push_event(BridgeEvent(
-                event_type=EventType.STATUS_UPDATE,
-                error_message="Cannot send — not connected",
-            ))
+            self._report_send_error("Cannot send — not connected")
+
+    def _on_send_done(self, future: Future):
+        e = future.exception()
+        if e is not None:
+            print(f"[Plasticity] Send failed: {e}")
+            self._report_send_error(f"Send failed: {e}", str(e))
+
+    def _report_send_error(self, status: str, error: Optional[str] = None):
+        self.status.error(status)
+        self.bridge.push_event(BridgeEvent(
+            event_type=EventType.STATUS_UPDATE,
+            error_message=error or status,
+        ))
+
+    def _next_id(self) -> int:
+        self.message_id += 1
+        return self.message_id
 
     # =========================================================================
     # Public API
@@ -278,50 +420,37 @@ class PlasticityClient:
         if not self.connected:
             return
         self.status.info("Refreshing all objects...")
-        self._send_and_wait(self._send(encode_list_all))
+        self._send(encode_list_all(self._next_id()))
 
     def list_visible(self):
         if not self.connected:
             return
         self.status.info("Refreshing visible objects...")
-        self._send_and_wait(self._send(encode_list_visible))
+        self._send(encode_list_visible(self._next_id()))
 
     def subscribe_all(self):
         if not self.connected:
             return
         self.status.info("Subscribing to live updates...")
-        self._send_and_wait(self._send(encode_subscribe_all))
+        self._send(encode_subscribe_all(self._next_id()))
         self.subscribed = True
 
     def unsubscribe(self):
         if not self.connected:
             return
         self.status.info("Unsubscribing...")
-        self._send_and_wait(self._send(encode_unsubscribe))
+        self._send(encode_unsubscribe(self._next_id()))
         self.subscribed = False
 
     def subscribe_some(self, filename: str, plasticity_ids: List[int]):
         if not self.connected or not plasticity_ids:
             return
-        self._send_and_wait(self._send_subscribe_some(filename, plasticity_ids))
+        self._send(encode_subscribe_some(
+            self._next_id(), filename, plasticity_ids))
 
     def refacet_some(self, filename, plasticity_ids, **kwargs):
         if not self.connected or not plasticity_ids:
             return
         self.status.info(f"Refaceting {len(plasticity_ids)} objects...")
-        self._send_and_wait(self._send_refacet(filename, plasticity_ids, **kwargs))
-
-    async def _send(self, encode_fn):
-        self.message_id += 1
-        msg = encode_fn(self.message_id)
-        await self.websocket.send(msg)
-
-    async def _send_subscribe_some(self, filename, ids):
-        self.message_id += 1
-        msg = encode_subscribe_some(self.message_id, filename, ids)
-        await self.websocket.send(msg)
-
-    async def _send_refacet(self, filename, ids, **kwargs):
-        self.message_id += 1
-        msg = encode_refacet_some(self.message_id, filename, ids, **kwargs)
-        await self.websocket.send(msg)
\ No newline at end of file
+        self._send(encode_refacet_some(
+            self._next_id(), filename, plasticity_ids, **kwargs))
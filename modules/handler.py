@@ -37,7 +37,12 @@ UNIT SCALE: Lives on the root null's scale transform, not baked into vertices.
 
 import c4d
 import array
-import json
+import base64
+import hashlib
+import sys
+from collections import defaultdict
+from itertools import chain, compress
+from operator import ne
 from typing import Dict, List, Optional, Any, Set, Tuple
 
 from modules.protocol import ObjectType, MessageType
@@ -50,9 +55,17 @@ BC_PLASTICITY_FILENAME = PLUGIN_ID + 2   # 1066931
 BC_PLASTICITY_GROUPS   = PLUGIN_ID + 3   # 1066932
 BC_PLASTICITY_FACE_IDS = PLUGIN_ID + 4   # 1066933
 BC_PLASTICITY_ROOT     = PLUGIN_ID + 5   # 1066934
+BC_PLASTICITY_GEOMHASH = PLUGIN_ID + 6   # 1066935
 
 MANAGED_NORMAL_TAG_NAME = "__plasticity_normals__"
 
+# Unbound SDK accessors for the scene-tree walks: calling these avoids a bound
+# method lookup on every visited object / container.
+_get_data_instance = c4d.BaseList2D.GetDataInstance
+_is_alive          = c4d.C4DAtom.IsAlive
+_bc_get_int32      = c4d.BaseContainer.GetInt32
+_bc_get_string     = c4d.BaseContainer.GetString
+
 # Plasticity sends vertex positions in metres; C4D's internal unit is
 # centimetres.  Multiply every incoming coordinate by this factor so the
 # geometry appears at the correct size *before* the user's unit_scale is
@@ -60,6 +73,57 @@ MANAGED_NORMAL_TAG_NAME = "__plasticity_normals__"
 _IMPORT_SCALE = 100.0
 
 
+# =============================================================================
+# Metadata encoding
+# =============================================================================
+
+# Format tag for packed int32 strings. Scenes saved by older versions hold a
+# JSON list ("[...]") under the same keys; neither base64 nor JSON can start
+# with this tag, so a future reader can tell the two encodings apart.
+_INT32S_TAG = "i32le:"
+
+
+def _pack_int32s(values):
+    """
+    Encode an int sequence for a BaseContainer string: the format tag plus
+    base64 of the values as little-endian int32. Several times smaller and
+    faster than JSON for the large groups / face_ids arrays.
+    """
+    data = values if getattr(values, 'typecode', None) == 'i' else array.array('i', values)
+    if sys.byteorder != 'little':
+        data = array.array('i', data)
+        data.byteswap()
+    return _INT32S_TAG + base64.b64encode(data).decode('ascii')
+
+
+# =============================================================================
+# Geometry fingerprint
+# =============================================================================
+
+def _geometry_hash(vertices, indices, faces, normals):
+    """
+    Digest of the incoming mesh buffers. Stored on the object (see
+    _geometry_stamp()) once a build completes, so an update carrying
+    byte-identical geometry (e.g. only visibility or parent changed) can skip
+    the rebuild.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    for code, buf in (('f', vertices), ('i', indices), ('i', faces), ('f', normals)):
+        h.update(len(buf).to_bytes(4, 'little'))
+        # Decoded buffers are already array('f'/'i'); only lists need packing
+        h.update(buf if getattr(buf, 'typecode', None) == code else array.array(code, buf))
+    return h.hexdigest()
+
+
+def _geometry_stamp(obj, geom_hash):
+    """
+    Value kept in BC_PLASTICITY_GEOMHASH: the payload digest plus the object's
+    data dirty count, so a mesh edited in C4D since the last build no longer
+    matches and is rebuilt from Plasticity.
+    """
+    return f"{geom_hash}:{obj.GetDirty(c4d.DIRTYFLAGS_DATA)}"
+
+
 # =============================================================================
 # Ear-clipping triangulation for concave N-gons
 # =============================================================================
@@ -262,18 +326,22 @@ class SceneHandler:
         self.bridge = bridge
         self.unit_scale = 1.0
 
-        self._items  = {}   # (filename, id) -> c4d.BaseObject  (mesh objects)
-        self._groups = {}   # (filename, id) -> c4d.BaseObject  (null groups)
+        self._items  = {}   # filename -> {id: c4d.BaseObject}  (mesh objects)
+        self._groups = {}   # filename -> {id: c4d.BaseObject}  (null groups)
         self._roots  = {}   # filename       -> c4d.BaseObject  (root nulls)
+        self._scanned = {}  # filename       -> _scan_stamp() of the last scan
+        self._last_child = {}  # parent GUID  -> last child we inserted under it
 
         # Fix #1: on_connect / on_disconnect run on the main thread via bridge
-        bridge.register_callback(EventType.CONNECTED,           self._on_connected)
-        bridge.register_callback(EventType.DISCONNECTED,        self._on_disconnected)
-        bridge.register_callback(EventType.LIST_RESPONSE,       self._on_list_response)
-        bridge.register_callback(EventType.TRANSACTION,         self._on_transaction)
-        bridge.register_callback(EventType.REFACET_RESPONSE,    self._on_refacet_response)
-        bridge.register_callback(EventType.NEW_VERSION,         self._on_new_version)
-        bridge.register_callback(EventType.NEW_FILE,            self._on_new_file)
+        bridge.register_many((
+            (EventType.CONNECTED,           self._on_connected),
+            (EventType.DISCONNECTED,        self._on_disconnected),
+            (EventType.LIST_RESPONSE,       self._on_list_response),
+            (EventType.TRANSACTION,         self._on_transaction),
+            (EventType.REFACET_RESPONSE,    self._on_refacet_response),
+            (EventType.NEW_VERSION,         self._on_new_version),
+            (EventType.NEW_FILE,            self._on_new_file),
+        ))
 
     # =========================================================================
     # Connection lifecycle (Fix #1: dispatched on the main thread)
@@ -289,11 +357,16 @@ class SceneHandler:
         self._items.clear()
         self._groups.clear()
         self._roots.clear()
+        self._scanned.clear()
+        self._last_child.clear()
 
     def on_disconnect(self):
+        # Every file's partitions at once (_purge_filename() for all of them)
         self._items.clear()
         self._groups.clear()
         self._roots.clear()
+        self._scanned.clear()
+        self._last_child.clear()
 
     # =========================================================================
     # Event handlers
@@ -304,21 +377,21 @@ class SceneHandler:
         data = event.data
         if not data:
             return
-        filename = data.get('filename', '')
+        filename = data.filename
         doc = c4d.documents.GetActiveDocument()
         if not doc:
             return
 
-        deferred_ngons = []
+        deferred = []
 
         doc.StartUndo()
         try:
             root = self._get_or_create_root(doc, filename)
-            self._prepare(doc, filename)
+            self._prepare(doc, filename, force=True)
 
             all_item_ids  = set()
             all_group_ids = set()
-            all_objects   = data.get('add', []) + data.get('update', [])
+            all_objects   = data.objects
 
             for obj_data in all_objects:
                 ot  = int(obj_data.get('type', -1))
@@ -328,29 +401,29 @@ class SceneHandler:
                 else:
                     all_item_ids.add(oid)
 
-            deferred_ngons = self._process_objects(doc, filename, root, all_objects)
-
-            stale = [k for k in self._items  if k[0] == filename and k[1] not in all_item_ids]
-            for k in stale:
-                obj = self._items.pop(k, None)
-                if obj and obj.GetDocument() == doc:
-                    doc.AddUndo(c4d.UNDOTYPE_DELETEOBJ, obj)
-                    obj.Remove()
+            # A full refresh always rebuilds, even when the payload is unchanged
+            deferred = self._process_objects(doc, filename, root, all_objects,
+                                             force=True)
 
-            stale = [k for k in self._groups if k[0] == filename and k[1] not in all_group_ids]
-            for k in stale:
-                grp = self._groups.pop(k, None)
-                if grp and grp.GetDocument() == doc:
-                    doc.AddUndo(c4d.UNDOTYPE_DELETEOBJ, grp)
-                    grp.Remove()
+            # Drop stale entries: one pass over each cache (items before
+            # groups), removing from the scene as they are popped.
+            for cache, keep in ((self._items.get(filename, {}), all_item_ids),
+                                (self._groups.get(filename, {}), all_group_ids)):
+                for oid in list(cache):
+                    if oid in keep:
+                        continue
+                    obj = cache.pop(oid)
+                    if obj and obj.GetDocument() == doc:
+                        doc.AddUndo(c4d.UNDOTYPE_DELETEOBJ, obj)
+                        obj.Remove()
 
         finally:
             doc.EndUndo()
 
         # MELT must run outside the undo block — SMC manages its own undo entries.
-        for obj, poly_groups in deferred_ngons:
-            self._create_ngon_groups(obj, poly_groups)
+        self._finish_geometry(deferred)
 
+        self._mark_scanned(doc, filename)
         c4d.EventAdd()
 
     def _on_transaction(self, event: BridgeEvent):
@@ -358,31 +431,31 @@ class SceneHandler:
         data = event.data
         if not data:
             return
-        filename = data.get('filename', '')
+        filename = data.filename
         doc = c4d.documents.GetActiveDocument()
         if not doc:
             return
 
         doc.StartUndo()
-        deferred_ngons = []
+        deferred = []
         try:
             root = self._get_or_create_root(doc, filename)
             self._prepare(doc, filename)
 
-            for oid in data.get('delete', []):
+            for oid in data.delete:
                 self._delete_item(doc, filename, oid)
 
-            all_objects = data.get('add', []) + data.get('update', [])
+            all_objects = data.objects
             if all_objects:
-                deferred_ngons = self._process_objects(doc, filename, root, all_objects)
+                deferred = self._process_objects(doc, filename, root, all_objects)
 
         finally:
             doc.EndUndo()
 
         # MELT must run outside the undo block — SMC manages its own undo entries.
-        for obj, poly_groups in deferred_ngons:
-            self._create_ngon_groups(obj, poly_groups)
+        self._finish_geometry(deferred)
 
+        self._mark_scanned(doc, filename)
         c4d.EventAdd()
 
     def _on_refacet_response(self, event: BridgeEvent):
@@ -397,21 +470,21 @@ class SceneHandler:
         data = event.data
         if not data:
             return
-        filename = data.get('filename', '')
+        filename = data.filename
         doc = c4d.documents.GetActiveDocument()
         if not doc:
             return
 
-        deferred_ngons = []   # [(obj, poly_groups)] — melted OUTSIDE undo block
+        deferred = []   # [(obj, poly_groups, geom_hash)] — finished OUTSIDE undo block
 
         doc.StartUndo()
         try:
             self._prepare(doc, filename)
 
-            for item in data.get('refaceted_objects', []):
+            file_items = self._items.get(filename, {})
+            for item in data.objects:
                 pid  = item.get('plasticity_id')
-                key  = (filename, pid)
-                obj  = self._items.get(key)
+                obj  = file_items.get(pid)
                 if not obj or obj.GetDocument() != doc:
                     continue
 
@@ -425,29 +498,35 @@ class SceneHandler:
                 if not verts:
                     continue
 
+                geom_hash = _geometry_hash(verts, indices, faces, normals)
+                if self._geometry_current(obj, geom_hash):
+                    # Already built from this payload; just refresh the stamp
+                    deferred.append((obj, [], geom_hash))
+                    continue
+
                 doc.AddUndo(c4d.UNDOTYPE_CHANGE, obj)
                 poly_groups = self._update_object_geometry(
                     obj, verts, indices, faces, normals)
                 self._copy_plasticity_meta(obj, pid, filename, groups, face_ids)
 
-                if poly_groups:
-                    deferred_ngons.append((obj, poly_groups))
+                if poly_groups is not None:
+                    deferred.append((obj, poly_groups, geom_hash))
 
         finally:
             doc.EndUndo()
 
         # SendModelingCommand(MCOMMAND_MELT) manages its own undo entries and
         # fails silently when called inside StartUndo/EndUndo — run it after.
-        for obj, poly_groups in deferred_ngons:
-            self._create_ngon_groups(obj, poly_groups)
+        self._finish_geometry(deferred)
 
+        self._mark_scanned(doc, filename)
         c4d.EventAdd()
 
     def _on_new_version(self, event: BridgeEvent):
         data = event.data
         if data:
-            fn  = data.get('filename', '')
-            ver = data.get('version', 0)
+            fn  = data.filename
+            ver = data.version
             msg = f"New version available — '{fn}' v{ver}. Click Refresh to update."
             self.bridge.status_message = msg
             print(f"[Plasticity] {msg}")
@@ -455,8 +534,13 @@ class SceneHandler:
     def _on_new_file(self, event: BridgeEvent):
         data = event.data
         if data:
-            fn  = data.get('filename', '')
+            fn  = data.filename
             msg = f"New file opened in Plasticity: '{fn}'. Click Refresh to import."
+            # Plasticity has one file open at a time: drop the caches of the
+            # file it replaced (closed, or renamed by Save As)
+            for old in set(self._roots) | set(self._items) | set(self._groups):
+                if old != fn:
+                    self._purge_filename(old)
             self.bridge.status_message = msg
             self.bridge.filename = fn
             print(f"[Plasticity] {msg}")
@@ -465,41 +549,93 @@ class SceneHandler:
     # Cache management
     # =========================================================================
 
-    def _prepare(self, doc, filename):
-        """Rebuild caches by scanning the scene — undo-safe."""
+    @staticmethod
+    def _scan_stamp(doc, root):
+        # Hierarchy and object-data counters: moves, deletes, undo/redo and
+        # edits to an object's container (e.g. its Plasticity id) all bump one.
+        return (doc, root,
+                doc.GetHDirty(c4d.HDIRTYFLAGS_OBJECT_HIERARCHY),
+                doc.GetHDirty(c4d.HDIRTYFLAGS_OBJECT))
+
+    def _caches_alive(self, filename):
+        """False if any cached object for filename has been freed."""
+        return all(map(_is_alive, chain(self._items.get(filename, {}).values(),
+                                        self._groups.get(filename, {}).values())))
+
+    def _prepare(self, doc, filename, force=False):
+        """
+        Rebuild caches by scanning the scene — undo-safe.
+
+        The scan is skipped when the document's objects are unchanged since
+        the caches were last known good (see _mark_scanned()) and every cached
+        object is still alive, so small transactions don't pay for a walk of
+        the whole tree. force=True always rescans.
+        """
         root = self._get_or_create_root(doc, filename)
-        self._items  = {k: v for k, v in self._items.items()  if k[0] != filename}
-        self._groups = {k: v for k, v in self._groups.items() if k[0] != filename}
+        if (not force
+                and self._scanned.get(filename) == self._scan_stamp(doc, root)
+                and self._caches_alive(filename)):
+            return
 
-        def scan(parent):
-            child = parent.GetDown()
-            while child:
-                bc  = child.GetDataInstance()
-                pid = bc.GetInt32(BC_PLASTICITY_ID, 0)
-                fn  = bc.GetString(BC_PLASTICITY_FILENAME, "")
-                if pid != 0 and fn == filename:
-                    if child.CheckType(c4d.Onull):
-                        self._groups[(fn, pid)] = child
-                    else:
-                        self._items[(fn, pid)] = child
-                scan(child)
-                child = child.GetNext()
+        items  = self._items[filename]  = {}
+        groups = self._groups[filename] = {}
+
+        get_data, get_int32, get_string = \
+            _get_data_instance, _bc_get_int32, _bc_get_string
+        id_key, fn_key = BC_PLASTICITY_ID, BC_PLASTICITY_FILENAME
 
-        scan(root)
+        # Iterative pre-order walk (same visiting order as recursion)
+        stack = [root.GetDown()]
+        while stack:
+            child = stack.pop()
+            if child is None:
+                continue
+            bc  = get_data(child)
+            pid = get_int32(bc, id_key, 0)
+            fn  = get_string(bc, fn_key, "")
+            if pid != 0 and fn == filename:
+                if child.CheckType(c4d.Onull):
+                    groups[pid] = child
+                else:
+                    items[pid] = child
+            stack.append(child.GetNext())
+            stack.append(child.GetDown())
+
+    def _purge_filename(self, filename):
+        """Drop every cache partition for filename (file closed or renamed)."""
+        self._items.pop(filename, None)
+        self._groups.pop(filename, None)
+        self._roots.pop(filename, None)
+        self._scanned.pop(filename, None)
+        # Keyed by parent GUID rather than filename, and only a validated
+        # hint, so it is cleared instead of searched for this file's parents
+        self._last_child.clear()
+
+    def _mark_scanned(self, doc, filename):
+        """Record that the caches for filename match the current hierarchy."""
+        root = self._roots.get(filename)
+        if root is not None:
+            self._scanned[filename] = self._scan_stamp(doc, root)
 
     # =========================================================================
     # Two-pass object processing
     # =========================================================================
 
-    def _process_objects(self, doc, filename, root, objects):
+    def _process_objects(self, doc, filename, root, objects, force=False):
         """
         Pass 1: Geometry — create new objects or update existing in-place.
         Pass 2: Hierarchy — re-parent, apply visibility.
 
         N-gon melts are deferred until after all insertions in Pass 1 so that
         the objects are guaranteed to be in the document before SMC runs.
+        force=True rebuilds existing meshes even when their geometry hash
+        matches.
+
+        Returns the (obj, poly_groups, geom_hash) list for _finish_geometry().
         """
-        deferred_ngons = []   # list of (obj, poly_groups)
+        deferred = []   # list of (obj, poly_groups, geom_hash)
+        file_items  = self._items.setdefault(filename, {})
+        file_groups = self._groups.setdefault(filename, {})
 
         # ── Pass 1: Geometry ──────────────────────────────────────────────────
         for item in objects:
@@ -520,33 +656,43 @@ class SceneHandler:
             if obj_type == ObjectType.GROUP:
                 if obj_id == 0:
                     continue
-                key = (filename, obj_id)
-                if key not in self._groups:
+                grp = file_groups.get(obj_id)
+                if grp is None:
                     grp = c4d.BaseObject(c4d.Onull)
                     grp.SetName(name)
                     self._copy_plasticity_meta(grp, obj_id, filename)
                     self._insert_last_child(doc, grp, root)
                     doc.AddUndo(c4d.UNDOTYPE_NEWOBJ, grp)
-                    self._groups[key] = grp
+                    file_groups[obj_id] = grp
                 else:
-                    self._groups[key].SetName(name)
+                    grp.SetName(name)
 
             elif obj_type in (ObjectType.SOLID, ObjectType.SHEET):
                 if not verts:
                     continue
 
-                key      = (filename, obj_id)
-                existing = self._items.get(key)
+                existing = file_items.get(obj_id)
 
                 if existing and existing.GetDocument() == doc:
-                    # IN-PLACE UPDATE — all user tags / animation survive
-                    doc.AddUndo(c4d.UNDOTYPE_CHANGE, existing)
-                    existing.SetName(name)
-                    # faces=[] means tri mode; standard objects carry no poly-membership
-                    pg = self._update_object_geometry(existing, verts, indices, [], normals)
-                    self._copy_plasticity_meta(existing, obj_id, filename, groups, face_ids)
-                    if pg:
-                        deferred_ngons.append((existing, pg))
+                    # IN-PLACE UPDATE — all user tags / animation survive.
+                    # The stamp is compared before anything touches the
+                    # object, and an unchanged mesh records no undo step.
+                    geom_hash = _geometry_hash(verts, indices, [], normals)
+                    rebuild   = force or not self._geometry_current(existing, geom_hash)
+                    renamed   = existing.GetName() != name
+                    if rebuild or renamed:
+                        doc.AddUndo(c4d.UNDOTYPE_CHANGE, existing)
+                    if renamed:
+                        existing.SetName(name)
+                    pg = []
+                    if rebuild:
+                        # faces=[] means tri mode; standard objects carry no poly-membership
+                        pg = self._update_object_geometry(
+                            existing, verts, indices, [], normals)
+                        self._copy_plasticity_meta(
+                            existing, obj_id, filename, groups, face_ids)
+                    if pg is not None:
+                        deferred.append((existing, pg, geom_hash))
 
                 else:
                     # NEW OBJECT (standard path = tri mode, poly_groups = [])
@@ -571,13 +717,13 @@ class SceneHandler:
                     self._copy_plasticity_meta(new_obj, obj_id, filename, groups, face_ids)
                     self._insert_last_child(doc, new_obj, root)
                     doc.AddUndo(c4d.UNDOTYPE_NEWOBJ, new_obj)
-                    self._items[key] = new_obj
-
-                    if poly_groups:
-                        deferred_ngons.append((new_obj, poly_groups))
+                    file_items[obj_id] = new_obj
+                    deferred.append((new_obj, poly_groups,
+                                     _geometry_hash(verts, indices, [], normals)))
 
-        # Deferred N-gon merges collected during Pass 1 — returned to caller so
-        # they can be run OUTSIDE the active StartUndo/EndUndo block.
+        # Deferred N-gon merges and hash stamps collected during Pass 1 —
+        # returned to caller so they can be run OUTSIDE the active
+        # StartUndo/EndUndo block.
         # (SendModelingCommand manages its own undo and fails inside undo blocks.)
 
         # ── Pass 2: Re-parent and apply visibility ────────────────────────────
@@ -594,13 +740,12 @@ class SceneHandler:
             vis = c4d.OBJECT_OFF if should_hide else c4d.OBJECT_UNDEF
 
             if obj_type == ObjectType.GROUP:
-                key = (filename, obj_id)
-                grp = self._groups.get(key)
+                grp = file_groups.get(obj_id)
                 if not grp:
                     continue
                 target_parent = root
-                if parent_id > 0 and (filename, parent_id) in self._groups:
-                    target_parent = self._groups[(filename, parent_id)]
+                if parent_id > 0:
+                    target_parent = file_groups.get(parent_id, root)
                 if grp.GetUp() != target_parent:
                     doc.AddUndo(c4d.UNDOTYPE_CHANGE, grp)
                     grp.Remove()
@@ -609,21 +754,37 @@ class SceneHandler:
                 grp[c4d.ID_BASEOBJECT_VISIBILITY_RENDER]  = vis
 
             elif obj_type in (ObjectType.SOLID, ObjectType.SHEET):
-                key = (filename, obj_id)
-                obj = self._items.get(key)
+                obj = file_items.get(obj_id)
                 if not obj:
                     continue
                 target_parent = root
-                if parent_id > 0 and (filename, parent_id) in self._groups:
-                    target_parent = self._groups[(filename, parent_id)]
+                if parent_id > 0:
+                    target_parent = file_groups.get(parent_id, root)
                 if obj.GetUp() != target_parent:
                     doc.AddUndo(c4d.UNDOTYPE_CHANGE, obj)
                     obj.Remove()
                     self._insert_last_child(doc, obj, target_parent)
-                obj[c4d.ID_BASEOBJECT_VISIBILITY_EDITOR] = vis
-                obj[c4d.ID_BASEOBJECT_VISIBILITY_RENDER]  = vis
+                # Only write changed values, so an unchanged object is left
+                # untouched between its geometry stamp and the next update
+                if obj[c4d.ID_BASEOBJECT_VISIBILITY_EDITOR] != vis:
+                    obj[c4d.ID_BASEOBJECT_VISIBILITY_EDITOR] = vis
+                if obj[c4d.ID_BASEOBJECT_VISIBILITY_RENDER] != vis:
+                    obj[c4d.ID_BASEOBJECT_VISIBILITY_RENDER]  = vis
 
-        return deferred_ngons
+        return deferred
+
+    def _finish_geometry(self, deferred):
+        """
+        Melt deferred N-gons, then stamp the geometry hash on every object
+        whose build completed. Must run outside any StartUndo/EndUndo block.
+        An object whose melt failed keeps its old stamp, so the next update
+        with the same geometry retries the build.
+        """
+        for obj, poly_groups, geom_hash in deferred:
+            if poly_groups and not self._create_ngon_groups(obj, poly_groups):
+                continue
+            obj.GetDataInstance().SetString(
+                BC_PLASTICITY_GEOMHASH, _geometry_stamp(obj, geom_hash))
 
     # =========================================================================
     # Geometry computation
@@ -636,6 +797,7 @@ class SceneHandler:
 
         Returns:
             (points, polys, normal_map, poly_groups)
+            normal_map is a flat array('i') of four vertex ids per polygon.
             poly_groups = [] means tri mode (no merging needed).
             poly_groups = [[...], [...]] means N-gon mode: groups of triangle
             poly indices that should be merged by _create_ngon_groups().
@@ -655,26 +817,25 @@ class SceneHandler:
         Coordinate swap: C4D X = Pl X,  C4D Y = Pl Z,  C4D Z = Pl Y.
         Winding:  CPolygon(a, c, b) — reversed for C4D front-face convention.
         """
-        vert_count = len(vertices) // 3
-        tri_count  = len(indices)  // 3
-
-        points = []
-        s = _IMPORT_SCALE
-        for i in range(vert_count):
-            points.append(c4d.Vector(
-                vertices[i * 3]     * s,
-                vertices[i * 3 + 2] * s,   # Plasticity Z → C4D Y
-                vertices[i * 3 + 1] * s,   # Plasticity Y → C4D Z
-            ))
-
-        polys      = []
-        normal_map = []
-        for i in range(tri_count):
-            a  = indices[i * 3]
-            b  = indices[i * 3 + 1]
-            c_ = indices[i * 3 + 2]
-            polys.append(c4d.CPolygon(a, c_, b))
-            normal_map.append((a, c_, b, b))
+        # Strided slices split the flat buffers into per-component columns so
+        # the swap is a tuple unpack instead of three index computations per
+        # vertex; zip() stops at the last complete triple like len() // 3 did.
+        s      = _IMPORT_SCALE
+        Vector = c4d.Vector
+        points = [Vector(x * s, z * s, y * s)   # Plasticity Z → C4D Y, Y → C4D Z
+                  for x, y, z in zip(vertices[0::3], vertices[1::3], vertices[2::3])]
+
+        tri_count = len(indices) // 3
+        end       = tri_count * 3
+        col_a, col_b, col_c = indices[0:end:3], indices[1:end:3], indices[2:end:3]
+        CPolygon  = c4d.CPolygon
+        polys     = [CPolygon(a, c_, b) for a, b, c_ in zip(col_a, col_b, col_c)]
+
+        # Corners (a, c, b, b) per triangle, filled column-wise
+        normal_map = array.array('i', bytes(16 * tri_count))
+        normal_map[0::4] = array.array('i', col_a)
+        normal_map[1::4] = array.array('i', col_c)
+        normal_map[2::4] = normal_map[3::4] = array.array('i', col_b)
 
         return points, polys, normal_map, []
 
@@ -703,36 +864,43 @@ class SceneHandler:
             the polygon topology, invalidating any pre-built normal data. The
             Phong tag handles smooth shading instead.
         """
-        vert_count = len(vertices) // 3
-
-        # Step 1: weld duplicate vertices
+        # Step 1: weld duplicate vertices. setdefault() both looks up and
+        # claims the next index, so each vertex costs one hash probe.
         vert_map   = {}
-        old_to_new = [0] * vert_count
+        old_to_new = [0] * (len(vertices) // 3)
         unique_pts = []
-        s = _IMPORT_SCALE
+        s      = _IMPORT_SCALE
+        Vector = c4d.Vector
 
-        for i in range(vert_count):
-            px = vertices[i * 3]
-            py = vertices[i * 3 + 1]
-            pz = vertices[i * 3 + 2]
+        for i, (px, py, pz) in enumerate(zip(vertices[0::3], vertices[1::3], vertices[2::3])):
             key = (round(px, 7), round(py, 7), round(pz, 7))
-            if key not in vert_map:
-                vert_map[key] = len(unique_pts)
-                unique_pts.append(c4d.Vector(px * s, pz * s, py * s))   # coord swap + scale
-            old_to_new[i] = vert_map[key]
-
-        new_indices = [old_to_new[idx] for idx in indices]
+            n   = len(unique_pts)
+            idx = vert_map.setdefault(key, n)
+            if idx == n:
+                unique_pts.append(Vector(px * s, pz * s, py * s))   # coord swap + scale
+            old_to_new[i] = idx
+
+        # Already-deduplicated buffers weld to the identity mapping; skip the
+        # remap and use the incoming indices as they are. The remap used to
+        # be what rejected out-of-range indices, so check the bound here.
+        if len(unique_pts) == len(old_to_new):
+            if indices and max(indices) >= len(old_to_new):
+                raise IndexError(f"vertex index {max(indices)} out of range "
+                                 f"for {len(old_to_new)} vertices")
+            new_indices = indices
+        else:
+            new_indices = list(map(old_to_new.__getitem__, indices))
 
         polys       = []
-        normal_map  = []
+        normal_map  = array.array('i')
         poly_groups = []   # list[list[int]]
         poly_idx    = 0    # running polygon counter
+        CPolygon    = c4d.CPolygon
 
-        # Find polygon boundaries (runs of equal values in 'faces')
+        # Find polygon boundaries (runs of equal values in 'faces'): compare
+        # each entry with its predecessor and keep the indices that differ.
         poly_starts = [0]
-        for i in range(1, len(faces)):
-            if faces[i] != faces[i - 1]:
-                poly_starts.append(i)
+        poly_starts.extend(compress(range(1, len(faces)), map(ne, faces[1:], faces)))
         poly_starts.append(len(faces))
 
         for p in range(len(poly_starts) - 1):
@@ -744,12 +912,14 @@ class SceneHandler:
 
             # Step 2: remove consecutive duplicate vertices after welding.
             # E.g. [5, 5, 7, 8, 8, 3] → [5, 7, 8, 3] with matching orig_vindices.
-            face_vindices = []
-            orig_vindices = []
-            for k in range(len(raw_face_vi)):
-                if k == 0 or raw_face_vi[k] != raw_face_vi[k - 1]:
-                    face_vindices.append(raw_face_vi[k])
-                    orig_vindices.append(raw_orig_vi[k])
+            keep = [True]
+            keep.extend(map(ne, raw_face_vi[1:], raw_face_vi))
+            if all(keep):
+                face_vindices = raw_face_vi
+                orig_vindices = raw_orig_vi
+            else:
+                face_vindices = list(compress(raw_face_vi, keep))
+                orig_vindices = list(compress(raw_orig_vi, keep))
             # Also check wrap-around: if last == first, drop last
             if len(face_vindices) > 1 and face_vindices[-1] == face_vindices[0]:
                 face_vindices.pop()
@@ -760,17 +930,14 @@ class SceneHandler:
                 continue
 
             # Step 3: triangulate — ear-clipping for concave safety
-            group_poly_indices = []
-
             if count == 3:
                 # Triangle — no triangulation needed
                 ia, ib, ic = face_vindices
-                polys.append(c4d.CPolygon(ia, ic, ib))      # reversed winding
-                normal_map.append((
+                polys.append(CPolygon(ia, ic, ib))      # reversed winding
+                normal_map.extend((
                     orig_vindices[0], orig_vindices[2],
                     orig_vindices[1], orig_vindices[1],
                 ))
-                group_poly_indices.append(poly_idx)
                 poly_idx += 1
 
             elif count == 4:
@@ -778,12 +945,11 @@ class SceneHandler:
                 # CPolygon with 4 distinct indices is a native quad.
                 # Reversed winding: (a, d, c, b) instead of (a, b, c, d).
                 ia, ib, ic, id_ = face_vindices
-                polys.append(c4d.CPolygon(ia, id_, ic, ib))
-                normal_map.append((
+                polys.append(CPolygon(ia, id_, ic, ib))
+                normal_map.extend((
                     orig_vindices[0], orig_vindices[3],
                     orig_vindices[2], orig_vindices[1],
                 ))
-                group_poly_indices.append(poly_idx)
                 poly_idx += 1
 
             else:
@@ -803,22 +969,18 @@ class SceneHandler:
                           f"falling back to fan triangulation")
                     ear_tris = [(0, t + 1, t + 2) for t in range(count - 2)]
 
-                for li_a, li_b, li_c in ear_tris:
-                    ia = face_vindices[li_a]
-                    ib = face_vindices[li_b]
-                    ic = face_vindices[li_c]
-
-                    polys.append(c4d.CPolygon(ia, ic, ib))   # reversed winding
-                    normal_map.append((
-                        orig_vindices[li_a], orig_vindices[li_c],
-                        orig_vindices[li_b], orig_vindices[li_b],
-                    ))
-                    group_poly_indices.append(poly_idx)
-                    poly_idx += 1
+                # Emit the whole face's triangles in one extend each
+                fv, ov = face_vindices, orig_vindices
+                polys.extend([CPolygon(fv[a], fv[c], fv[b])     # reversed winding
+                              for a, b, c in ear_tris])
+                normal_map.extend([v for a, b, c in ear_tris
+                                   for v in (ov[a], ov[c], ov[b], ov[b])])
 
-            # Only groups with 2+ triangles need merging
-            if len(group_poly_indices) > 1:
-                poly_groups.append(group_poly_indices)
+                # Only groups with 2+ triangles need merging
+                end = poly_idx + len(ear_tris)
+                if end - poly_idx > 1:
+                    poly_groups.append(list(range(poly_idx, end)))
+                poly_idx = end
 
         return unique_pts, polys, normal_map, poly_groups
 
@@ -828,13 +990,23 @@ class SceneHandler:
 
     @staticmethod
     def _write_points_and_polys(obj, points, polys):
-        for i, pt   in enumerate(points): obj.SetPoint(i, pt)
-        for i, poly in enumerate(polys):  obj.SetPolygon(i, poly)
+        # One bulk call for the points; the Python SDK has no polygon
+        # counterpart, so polygons still go through a bound SetPolygon.
+        obj.SetAllPoints(points)
+        set_polygon = obj.SetPolygon
+        for i, poly in enumerate(polys):
+            set_polygon(i, poly)
 
     # =========================================================================
     # In-place geometry update
     # =========================================================================
 
+    @staticmethod
+    def _geometry_current(obj, geom_hash):
+        """True if obj was last built from geom_hash and is unedited since."""
+        return (obj.GetDataInstance().GetString(BC_PLASTICITY_GEOMHASH, "")
+                == _geometry_stamp(obj, geom_hash))
+
     def _update_object_geometry(self, obj, vertices, indices, faces, normals):
         """
         Replace all geometry on an existing PolygonObject in-place.
@@ -842,19 +1014,21 @@ class SceneHandler:
         Only the managed NormalTag is stripped; all user tags survive.
         In N-gon mode (faces is non-empty), NormalTag is skipped entirely
         because it would be invalidated by MCOMMAND_MELT. Phong handles shading.
+        Callers skip this when _geometry_current() says the mesh is up to date.
 
         Returns:
-            poly_groups (list[list[int]]) — non-empty in N-gon mode.
-            The CALLER is responsible for running _create_ngon_groups() OUTSIDE
-            any active StartUndo/EndUndo block, because SendModelingCommand
-            (MCOMMAND_MELT) manages its own undo entries and fails silently
-            when called inside an existing undo context.
+            poly_groups (list[list[int]]) — non-empty in N-gon mode; None when
+            nothing was built.
+            The CALLER is responsible for passing it to _finish_geometry()
+            OUTSIDE any active StartUndo/EndUndo block, because
+            SendModelingCommand (MCOMMAND_MELT) manages its own undo entries
+            and fails silently when called inside an existing undo context.
         """
         points, polys, normal_map, poly_groups = self._compute_geometry(
             vertices, indices, faces, normals
         )
         if not polys:
-            return []
+            return None
 
         self._strip_managed_tags(obj)
         obj.ResizeObject(len(points), len(polys))
@@ -889,52 +1063,69 @@ class SceneHandler:
 
     def _apply_normals(self, obj, normals, normal_map):
         """Write per-corner normals. Tries modern SetPolygon API, falls back to int16."""
-        poly_count   = obj.GetPolygonCount()
-        normal_count = len(normals) // 3
+        poly_count = obj.GetPolygonCount()
+        # Split the flat buffer into per-component columns once; the per-vertex
+        # normals below are built from them instead of from v_id * 3 + k.
+        nx, ny, nz   = normals[0::3], normals[1::3], normals[2::3]
+        normal_count = len(nz)
         if poly_count == 0 or normal_count == 0:
             return
 
+        # normal_map is flat (four vertex ids per polygon). Pad it once so the
+        # loops below need no bounds check; unmapped corners use vertex 0.
+        missing = 4 * poly_count - len(normal_map)
+        if missing > 0:
+            normal_map = normal_map + array.array('i', bytes(4 * missing))
+        corners = normal_map[:4 * poly_count]
+
+        # Validate the ids once. In the rare bad case, out-of-range ids are
+        # remapped to a single fallback entry appended at index normal_count,
+        # rather than checking every corner in the loops below.
+        fallback = max(corners) >= normal_count or min(corners) < 0
+        if fallback:
+            corners = array.array('i', (c if 0 <= c < normal_count else normal_count
+                                        for c in corners))
+            bad = corners.count(normal_count)
+            print(f"[Plasticity] {bad} normal map corners reference vertices "
+                  f"outside the {normal_count} normals received; using fallbacks")
+
         tag = c4d.NormalTag(poly_count)
         tag.SetName(MANAGED_NORMAL_TAG_NAME)
         obj.InsertTag(tag)
 
-        def _nvec(v_id):
-            if v_id * 3 + 2 < len(normals):
-                return c4d.Vector(
-                    normals[v_id * 3],
-                    normals[v_id * 3 + 2],   # Plasticity Nz → C4D Ny
-                    normals[v_id * 3 + 1],   # Plasticity Ny → C4D Nz
-                )
-            return c4d.Vector(0.0, 1.0, 0.0)
-
         # Modern API (C4D 2023 / S26+)
         try:
             data_w = tag.GetDataAddressW()
+
+            # One Vector per vertex normal, shared by every corner that uses
+            # it (SetPolygon copies the values into the tag).
+            Vector = c4d.Vector
+            nvecs  = [Vector(x, z, y)   # Plasticity Nz → C4D Ny, Ny → C4D Nz
+                      for x, y, z in zip(nx, ny, nz)]
+            if fallback:
+                nvecs.append(Vector(0.0, 1.0, 0.0))
+            nv = list(map(nvecs.__getitem__, corners))
+
+            set_polygon = c4d.NormalTag.SetPolygon
             for i in range(poly_count):
-                ids = normal_map[i] if i < len(normal_map) else (0, 0, 0, 0)
-                c4d.NormalTag.SetPolygon(data_w, i,
-                                         {c: _nvec(v) for c, v in zip('abcd', ids)})
+                o = i * 4
+                set_polygon(data_w, i, {
+                    'a': nv[o],     'b': nv[o + 1],
+                    'c': nv[o + 2], 'd': nv[o + 3],
+                })
             return
         except (AttributeError, TypeError):
             pass
 
-        # Legacy API: raw int16 buffer
-        data = array.array('h')
-
+        # Legacy API: raw int16 buffer. Each vertex normal is quantized and
+        # axis-swapped once; corners then just gather the packed triple.
         def pack_n(v):
             return int(max(-32767.0, min(32767.0, v * 32767.0)))
 
-        for i in range(poly_count):
-            ids = normal_map[i] if i < len(normal_map) else (0, 0, 0, 0)
-            for v_id in ids:
-                if v_id * 3 + 2 < len(normals):
-                    data.extend([
-                        pack_n(normals[v_id * 3]),
-                        pack_n(normals[v_id * 3 + 2]),
-                        pack_n(normals[v_id * 3 + 1]),
-                    ])
-                else:
-                    data.extend([0, 0, 0])
+        packed = list(zip(map(pack_n, nx), map(pack_n, nz), map(pack_n, ny)))
+        if fallback:
+            packed.append((0, 0, 0))
+        data = array.array('h', chain.from_iterable(map(packed.__getitem__, corners)))
 
         buf = tag.GetLowlevelDataAddressW()
         if buf:
@@ -955,9 +1146,10 @@ class SceneHandler:
         in later iterations would target the wrong polygons.
 
         Solution (Ferdinand, Maxon Developer Forum 2021):
-          Store polygon identity as the (a, b, c, d) vertex-index tuple of each
-          CPolygon. Before each melt, rebuild an inverted index from the current
-          mesh state to translate the stored identity back to the live index.
+          Store polygon identity as the (a, b, c, d) vertex indices of each
+          CPolygon, packed into one exact integer (a base-point_count numeral).
+          Before each melt, rebuild an inverted index from the current mesh
+          state to translate the stored identity back to the live index.
 
           This is collision-safe for all manifold meshes. The only theoretical
           failure case — two polygons with identical vertex tuples — cannot occur
@@ -969,21 +1161,25 @@ class SceneHandler:
                          indices (from _compute_ngon_geometry's poly_idx counter)
                          that should be melted into a single N-gon.
 
+        Returns:
+            False if any MCOMMAND_MELT failed, True otherwise.
+
         Ref: https://developers.maxon.net/forum/topic/13458/set-ngons-with-python/7
         """
         groups_to_melt = [g for g in poly_groups if len(g) >= 2]
         if not groups_to_melt:
-            return
+            return True
 
         doc = obj.GetDocument()
 
         # Build the identity index from the initial mesh state (before any melts).
-        # Maps original_poly_index -> (a, b, c, d) vertex tuple.
+        # polygon_identity[original_poly_index] -> packed (a, b, c, d) key.
+        # Every vertex index is < base, so the packing is collision-free.
+        base = obj.GetPointCount()
         all_polys = obj.GetAllPolygons()
-        polygon_identity = {
-            i: (cp.a, cp.b, cp.c, cp.d)
-            for i, cp in enumerate(all_polys)
-        }
+        polygon_identity = [((cp.a * base + cp.b) * base + cp.c) * base + cp.d
+                            for cp in all_polys]
+        poly_total = len(all_polys)
 
         # ── Step 1: Collect edges per group ──────────────────────────────────
         # Each polygon is a triangle (d == c) from ear-clip triangulation.
@@ -992,10 +1188,10 @@ class SceneHandler:
         for group in groups_to_melt:
             edges = set()
             for pid in group:
-                identity = polygon_identity.get(pid)
-                if identity is None:
+                if pid >= poly_total:
                     continue
-                a, b, c, d = identity
+                cp = all_polys[pid]
+                a, b, c, d = cp.a, cp.b, cp.c, cp.d
                 if c == d:                               # triangle
                     verts = (a, b, c)
                 else:                                    # quad (shouldn't happen
@@ -1045,33 +1241,42 @@ class SceneHandler:
             batches[color].append(gi)
 
         # ── Step 4: Melt each batch ──────────────────────────────────────────
+        live_polys = all_polys   # polygons as of the last fetch; None after a melt
+        inverted   = None
+        ok         = True
         for batch in batches:
             if not batch:
                 continue
 
             # Rebuild inverted index for the CURRENT mesh state.
-            # Must be rebuilt before each batch because the prior batch's melt
-            # changed polygon indices.
-            inverted = {
-                (cp.a, cp.b, cp.c, cp.d): i
-                for i, cp in enumerate(obj.GetAllPolygons())
-            }
+            # Needed whenever a prior melt changed polygon indices; the first
+            # batch reuses the polygons fetched above.
+            if inverted is None:
+                if live_polys is None:
+                    live_polys = obj.GetAllPolygons()
+                inverted = {
+                    ((cp.a * base + cp.b) * base + cp.c) * base + cp.d: i
+                    for i, cp in enumerate(live_polys)
+                }
 
             # Translate all original poly indices in this batch to live indices.
             real_indices = []
             for gi in batch:
                 for orig_pid in groups_to_melt[gi]:
-                    id_key = polygon_identity.get(orig_pid)
-                    if id_key is not None and id_key in inverted:
-                        real_indices.append(inverted[id_key])
+                    if orig_pid >= poly_total:
+                        continue
+                    live = inverted.get(polygon_identity[orig_pid])
+                    if live is not None:
+                        real_indices.append(live)
 
             if len(real_indices) < 2:
                 continue
 
-            sel = obj.GetPolygonS()
-            sel.DeselectAll()
+            # Whole selection in one SetAll call rather than a Select per polygon
+            states = [False] * obj.GetPolygonCount()
             for pid in real_indices:
-                sel.Select(pid)
+                states[pid] = True
+            obj.GetPolygonS().SetAll(states)
 
             result = c4d.utils.SendModelingCommand(
                 command=c4d.MCOMMAND_MELT,
@@ -1080,11 +1285,15 @@ class SceneHandler:
                 bc=c4d.BaseContainer(),
                 doc=doc,
             )
+            live_polys = inverted = None
             if not result:
+                ok = False
                 grp_count = len(batch)
                 print(f"[Plasticity] Warning: MCOMMAND_MELT failed for "
                       f"batch of {grp_count} groups")
 
+        return ok
+
     # =========================================================================
     # Metadata helpers
     # =========================================================================
@@ -1095,9 +1304,9 @@ class SceneHandler:
         bc.SetInt32(BC_PLASTICITY_ID, int(plasticity_id))
         bc.SetString(BC_PLASTICITY_FILENAME, str(filename))
         if groups   is not None:
-            bc.SetString(BC_PLASTICITY_GROUPS,   json.dumps(groups))
+            bc.SetString(BC_PLASTICITY_GROUPS,   _pack_int32s(groups))
         if face_ids is not None:
-            bc.SetString(BC_PLASTICITY_FACE_IDS, json.dumps(face_ids))
+            bc.SetString(BC_PLASTICITY_FACE_IDS, _pack_int32s(face_ids))
 
     # =========================================================================
     # Scene-tree helpers
@@ -1108,20 +1317,24 @@ class SceneHandler:
         Get or create the root Null for a Plasticity filename.
         Identified by BC_PLASTICITY_ROOT marker — immune to user renaming.
 
-        Fix #4: Uses a recursive scan of the entire document hierarchy so that
-        root nulls accidentally moved inside other objects are still found,
-        preventing duplicate root creation.
+        Fix #4: Scans the entire document hierarchy so that root nulls
+        accidentally moved inside other objects are still found, preventing
+        duplicate root creation.
         """
         # Fast path: check cache
-        if filename in self._roots:
-            r = self._roots[filename]
+        r = self._roots.get(filename)
+        if r is not None and r.IsAlive():
             if r.GetDocument() == doc:
-                s = self.unit_scale
-                r[c4d.ID_BASEOBJECT_SCALE] = c4d.Vector(s, s, s)
+                s     = self.unit_scale
+                scale = c4d.Vector(s, s, s)
+                # Skip no-op writes: they would mark the object dirty and
+                # defeat _prepare()'s scan stamp.
+                if r[c4d.ID_BASEOBJECT_SCALE] != scale:
+                    r[c4d.ID_BASEOBJECT_SCALE] = scale
                 return r
 
-        # Recursive scan of the full document tree
-        found = self._find_root_recursive(doc.GetFirstObject(), doc, filename)
+        # Scan of the full document tree
+        found = self._find_root(doc.GetFirstObject(), filename)
         if found:
             self._roots[filename] = found
             s = self.unit_scale
@@ -1142,43 +1355,58 @@ class SceneHandler:
         self._roots[filename] = root
         return root
 
-    def _find_root_recursive(self, obj, doc, filename):
+    @staticmethod
+    def _find_root(first, filename):
         """
-        Walk the full scene hierarchy to find a root null matching filename.
-        Returns the first match or None.
+        Walk the full scene hierarchy, starting at first and its siblings, to
+        find a root null matching filename. Iterative pre-order walk, so deep
+        hierarchies cost no Python recursion. Returns the first match or None.
         """
-        while obj:
-            bc = obj.GetDataInstance()
-            if (obj.CheckType(c4d.Onull)
+        get_data, get_string = _get_data_instance, _bc_get_string
+        onull = c4d.Onull
+
+        stack = [first]
+        while stack:
+            obj = stack.pop()
+            if obj is None:
+                continue
+            bc = get_data(obj)
+            if (obj.CheckType(onull)
                     and bc.GetBool(BC_PLASTICITY_ROOT)
-                    and bc.GetString(BC_PLASTICITY_FILENAME, "") == filename):
+                    and get_string(bc, BC_PLASTICITY_FILENAME, "") == filename):
                 return obj
-            # Recurse into children
-            found = self._find_root_recursive(obj.GetDown(), doc, filename)
-            if found:
-                return found
-            obj = obj.GetNext()
+            stack.append(obj.GetNext())
+            stack.append(obj.GetDown())
         return None
 
     def _delete_item(self, doc, filename, obj_id):
-        key = (filename, obj_id)
-        obj = self._items.pop(key, None)
+        file_items = self._items.get(filename)
+        obj = file_items.pop(obj_id, None) if file_items else None
         if obj and obj.GetDocument() == doc:
             doc.AddUndo(c4d.UNDOTYPE_DELETEOBJ, obj)
             obj.Remove()
 
-    @staticmethod
-    def _insert_last_child(doc, obj, parent):
+    def _insert_last_child(self, doc, obj, parent):
         """Append obj as last child of parent (InsertObject default is first child)."""
-        last  = None
-        child = parent.GetDown()
-        while child:
-            last  = child
-            child = child.GetNext()
+        key  = parent.GetGUID()
+        last = self._last_child.get(key)
+        # The remembered child is only used while it is still parent's last
+        # child; otherwise (user edits, deletes, undo) fall back to walking.
+        try:
+            if last is not None and (last.GetUp() != parent or last.GetNext() is not None):
+                last = None
+        except ReferenceError:
+            last = None
+        if last is None:
+            child = parent.GetDown()
+            while child:
+                last  = child
+                child = child.GetNext()
         if last:
             doc.InsertObject(obj, pred=last)
         else:
             doc.InsertObject(obj, parent=parent)
+        self._last_child[key] = obj
 
     # =========================================================================
     # Public interface for dialog
@@ -1196,23 +1424,29 @@ class SceneHandler:
                 root[c4d.ID_BASEOBJECT_SCALE] = c4d.Vector(s, s, s)
         c4d.EventAdd()
 
-    def get_selected_plasticity_ids(self, doc):
-        """Return (filename, plasticity_id) for all selected Plasticity objects."""
-        ids       = []
+    def get_selected_plasticity_ids_by_file(self, doc) -> Dict[str, List[int]]:
+        """Return {filename: [plasticity_id, ...]} for the selected Plasticity objects."""
+        by_file   = defaultdict(list)
         selection = doc.GetActiveObjects(c4d.GETACTIVEOBJECTFLAGS_CHILDREN)
 
-        def collect(obj):
-            bc  = obj.GetDataInstance()
-            pid = bc.GetInt32(BC_PLASTICITY_ID, 0)
-            fn  = bc.GetString(BC_PLASTICITY_FILENAME, "")
+        get_data, get_int32, get_string = \
+            _get_data_instance, _bc_get_int32, _bc_get_string
+        id_key, fn_key = BC_PLASTICITY_ID, BC_PLASTICITY_FILENAME
+
+        # Iterative pre-order walk; only nulls (groups/roots) are descended into
+        stack = list(reversed(selection))
+        while stack:
+            obj = stack.pop()
+            bc  = get_data(obj)
+            pid = get_int32(bc, id_key, 0)
+            fn  = get_string(bc, fn_key, "")
             if pid != 0 and fn:
-                ids.append((fn, pid))
+                by_file[fn].append(pid)
             if obj.CheckType(c4d.Onull):
+                children = []
                 child = obj.GetDown()
                 while child:
-                    collect(child)
+                    children.append(child)
                     child = child.GetNext()
-
-        for obj in selection:
-            collect(obj)
-        return ids
\ No newline at end of file
+                stack.extend(reversed(children))
+        return dict(by_file)
\ No newline at end of file
@@ -0,0 +1,70 @@
+"""
+Lightweight latency recorder for main-thread handlers.
+
+Command(), the Timer/CoreMessage tick and bridge callback dispatch all run on
+C4D's main thread, so any time they take is UI latency. LatencyRing keeps the
+last N (handler name, duration) samples in preallocated storage — recording is
+a couple of index stores, cheap enough to leave on permanently — and can
+summarise the slowest handlers on demand.
+"""
+
+from array import array
+from typing import List, Tuple
+
+
+class LatencyRing:
+    """Fixed-size ring buffer of handler durations in nanoseconds."""
+
+    __slots__ = ("_names", "_ns", "_size", "_index", "_count")
+
+    def __init__(self, size: int = 512):
+        self._names = [None] * size
+        self._ns    = array("Q", bytes(8 * size))
+        self._size  = size
+        self._index = 0
+        self._count = 0
+
+    def push(self, name: str, ns: int):
+        """Record one sample; the oldest is overwritten once the ring is full."""
+        i = self._index
+        self._names[i] = name
+        self._ns[i]    = ns
+        i += 1
+        self._index = 0 if i == self._size else i
+        if self._count < self._size:
+            self._count += 1
+
+    def clear(self):
+        self._index = 0
+        self._count = 0
+
+    def summary(self, top: int = 10) -> List[Tuple[str, int, int, int]]:
+        """
+        Return up to top (name, calls, max_ns, mean_ns) rows over the samples
+        currently held, slowest max first.
+        """
+        stats = {}
+        names, ns = self._names, self._ns
+        for i in range(self._count):
+            entry = stats.get(names[i])
+            if entry is None:
+                stats[names[i]] = [1, ns[i], ns[i]]
+            else:
+                entry[0] += 1
+                entry[1] += ns[i]
+                if ns[i] > entry[2]:
+                    entry[2] = ns[i]
+        rows = [(name, calls, worst, total // calls)
+                for name, (calls, total, worst) in stats.items()]
+        rows.sort(key=lambda row: row[2], reverse=True)
+        return rows[:top]
+
+    def format_summary(self, top: int = 10) -> str:
+        rows = self.summary(top)
+        if not rows:
+            return "[Plasticity] No handler timings recorded"
+        lines = [f"[Plasticity] Slowest handlers (last {self._count} samples):"]
+        for name, calls, worst, mean in rows:
+            lines.append(f"  {name:<28} calls={calls:<5} "
+                         f"max={worst / 1e6:8.3f} ms  mean={mean / 1e6:8.3f} ms")
+        return "\n".join(lines)
@@ -2,11 +2,14 @@
 Protocol definitions and binary message parsing for Plasticity WebSocket communication.
 
 All message types and binary formats match the Blender addon exactly.
-Uses struct.unpack_from for fast bulk decoding instead of Python loops.
+Numeric buffers are decoded straight into array.array (4 bytes per element)
+instead of lists of boxed Python numbers.
 """
 
 import struct
 import array
+import functools
+import sys
 from enum import IntEnum
 from typing import Tuple, List, Dict, Any, Optional
 
@@ -31,6 +34,10 @@ class MessageType(IntEnum):
     REFACET_SOME_1 = 26
 
 
+# Raw u32 values of every MessageType, for validating without MessageType(raw)
+_KNOWN_MESSAGE_TYPES = frozenset(int(m) for m in MessageType)
+
+
 class ObjectType(IntEnum):
     SOLID = 0
     SHEET = 1
@@ -49,32 +56,55 @@ class FacetShapeType(IntEnum):
 # Encoding (client -> server)
 # =============================================================================
 
+# Fixed-size requests are a u32 message type + u32 message id; the type half
+# is encoded once here and only the id is packed per call.
+_U32 = struct.Struct("<I")
+
+_LIST_ALL_PREFIX       = _U32.pack(MessageType.LIST_ALL_1)
+_LIST_VISIBLE_PREFIX   = _U32.pack(MessageType.LIST_VISIBLE_1)
+_SUBSCRIBE_ALL_PREFIX  = _U32.pack(MessageType.SUBSCRIBE_ALL_1)
+_UNSUBSCRIBE_PREFIX    = _U32.pack(MessageType.UNSUBSCRIBE_ALL_1)
+
+
 def encode_list_all(message_id: int) -> bytes:
-    return struct.pack("<II", MessageType.LIST_ALL_1, message_id)
+    return _LIST_ALL_PREFIX + _U32.pack(message_id)
 
 
 def encode_list_visible(message_id: int) -> bytes:
-    return struct.pack("<II", MessageType.LIST_VISIBLE_1, message_id)
+    return _LIST_VISIBLE_PREFIX + _U32.pack(message_id)
 
 
 def encode_subscribe_all(message_id: int) -> bytes:
-    return struct.pack("<II", MessageType.SUBSCRIBE_ALL_1, message_id)
+    return _SUBSCRIBE_ALL_PREFIX + _U32.pack(message_id)
 
 
 def encode_unsubscribe(message_id: int) -> bytes:
-    return struct.pack("<II", MessageType.UNSUBSCRIBE_ALL_1, message_id)
+    return _UNSUBSCRIBE_PREFIX + _U32.pack(message_id)
 
 
-def encode_subscribe_some(message_id: int, filename: str, plasticity_ids: List[int]) -> bytes:
-    msg = struct.pack("<II", MessageType.SUBSCRIBE_SOME_1, message_id)
+@functools.lru_cache(maxsize=64)
+def _struct(fmt: str) -> struct.Struct:
+    """Compiled Struct for a variable-length message layout."""
+    return struct.Struct(fmt)
+
+
+def _padded_filename(filename: str) -> Tuple[bytes, int]:
+    """UTF-8 filename and its length rounded up to the 4-byte boundary."""
     fn = filename.encode('utf-8')
-    msg += struct.pack("<I", len(fn))
-    msg += fn
-    msg += b'\x00' * ((4 - len(fn) % 4) % 4)
-    msg += struct.pack("<I", len(plasticity_ids))
-    for pid in plasticity_ids:
-        msg += struct.pack("<I", pid)
-    return msg
+    return fn, len(fn) + (4 - len(fn) % 4) % 4
+
+
+def encode_subscribe_some(message_id: int, filename: str, plasticity_ids: List[int]) -> bytes:
+    fn, fn_padded = _padded_filename(filename)
+    n = len(plasticity_ids)
+    # 's' zero-fills the filename out to its padded length
+    return _struct(f"<III{fn_padded}sI{n}I").pack(
+        MessageType.SUBSCRIBE_SOME_1, message_id,
+        len(fn), fn, n, *plasticity_ids)
+
+
+# Refacet options following the id list; fixed size, so compiled once.
+_REFACET_TRAILER = struct.Struct("<I4fII4fI")
 
 
 def encode_refacet_some(
@@ -85,104 +115,109 @@ def encode_refacet_some(
     min_width=0.0, max_width=0.0, curve_chord_max=0.0,
     shape=FacetShapeType.CUT
 ) -> bytes:
-    msg = struct.pack("<II", MessageType.REFACET_SOME_1, message_id)
-    fn = filename.encode('utf-8')
-    msg += struct.pack("<I", len(fn))
-    msg += fn
-    msg += b'\x00' * ((4 - len(fn) % 4) % 4)
-    msg += struct.pack("<I", len(plasticity_ids))
-    for pid in plasticity_ids:
-        msg += struct.pack("<I", pid)
-    msg += struct.pack("<I", 1 if relative_to_bbox else 0)
-    msg += struct.pack("<f", curve_chord_tolerance)
-    msg += struct.pack("<f", curve_chord_angle)
-    msg += struct.pack("<f", surface_plane_tolerance)
-    msg += struct.pack("<f", surface_plane_angle)
-    msg += struct.pack("<I", 1 if match_topology else 0)
-    msg += struct.pack("<I", max_sides)
-    msg += struct.pack("<f", plane_angle)
-    msg += struct.pack("<f", min_width)
-    msg += struct.pack("<f", max_width)
-    msg += struct.pack("<f", curve_chord_max)
-    msg += struct.pack("<I", shape.value)
-    return msg
+    fn, fn_padded = _padded_filename(filename)
+    n = len(plasticity_ids)
+    # The header layout only varies with the filename padding and the ids go
+    # in as a raw array, so a new selection size never compiles a new Struct.
+    head = _struct(f"<III{fn_padded}sI")
+    ids_offset = head.size
+    trailer_offset = ids_offset + 4 * n
+    buf = bytearray(trailer_offset + _REFACET_TRAILER.size)
+    head.pack_into(buf, 0, MessageType.REFACET_SOME_1, message_id,
+                   len(fn), fn, n)
+    ids = array.array('I', plasticity_ids)
+    if not _NATIVE_LITTLE_ENDIAN:
+        ids.byteswap()
+    buf[ids_offset:trailer_offset] = ids.tobytes()
+    _REFACET_TRAILER.pack_into(
+        buf, trailer_offset,
+        1 if relative_to_bbox else 0,
+        curve_chord_tolerance, curve_chord_angle,
+        surface_plane_tolerance, surface_plane_angle,
+        1 if match_topology else 0, max_sides,
+        plane_angle, min_width, max_width, curve_chord_max,
+        shape.value)
+    return bytes(buf)
 
 
 # =============================================================================
 # Decoding helpers (fast bulk reads)
 # =============================================================================
 
-def _read_u32(view, offset):
-    return struct.unpack_from('<I', view, offset)[0], offset + 4
-
+# The scalar reader uses a precompiled Struct so the format string isn't
+# looked up on every field.
+_unpack_u32 = _U32.unpack_from
 
-def _read_i32(view, offset):
-    return struct.unpack_from('<i', view, offset)[0], offset + 4
 
-
-def _read_f32(view, offset):
-    return struct.unpack_from('<f', view, offset)[0], offset + 4
+def _read_u32(view, offset):
+    return _unpack_u32(view, offset)[0], offset + 4
 
 
 def _read_string(view, offset):
     length, offset = _read_u32(view, offset)
     if length == 0:
         return "", offset
-    raw = bytes(view[offset:offset + length])
-    try:
-        s = raw.decode('utf-8')
-    except UnicodeDecodeError:
-        s = raw.decode('utf-8', errors='replace')
+    # Decode straight from the frame's buffer — no intermediate bytes copy
+    s = str(view[offset:offset + length], 'utf-8', 'replace')
     offset += length
     offset += (4 - length % 4) % 4  # padding
     return s, offset
 
 
-def _read_float_array(view, offset, count):
-    """Read `count` float32 values as a flat list."""
+_NATIVE_LITTLE_ENDIAN = sys.byteorder == "little"
+
+
+def _read_typed_array(view, offset, count, typecode):
+    """Read `count` little-endian 4-byte values into an array.array."""
+    data = array.array(typecode)
     if count == 0:
-        return [], offset
+        return data, offset
     byte_len = count * 4
-    data = struct.unpack_from(f'<{count}f', view, offset)
-    return list(data), offset + byte_len
+    chunk = view[offset:offset + byte_len]
+    if len(chunk) != byte_len:
+        raise struct.error(f"need {byte_len} bytes at offset {offset}, got {len(chunk)}")
+    data.frombytes(chunk)
+    if not _NATIVE_LITTLE_ENDIAN:
+        data.byteswap()
+    return data, offset + byte_len
+
+
+def _read_float_array(view, offset, count):
+    """Read `count` float32 values as a flat array('f')."""
+    return _read_typed_array(view, offset, count, 'f')
 
 
 def _read_int_array(view, offset, count):
-    """Read `count` int32 values as a flat list."""
-    if count == 0:
-        return [], offset
-    byte_len = count * 4
-    data = struct.unpack_from(f'<{count}i', view, offset)
-    return list(data), offset + byte_len
+    """Read `count` int32 values as a flat array('i')."""
+    return _read_typed_array(view, offset, count, 'i')
 
 
 def _read_uint_array(view, offset, count):
-    """Read `count` uint32 values as a flat list."""
-    if count == 0:
-        return [], offset
-    byte_len = count * 4
-    data = struct.unpack_from(f'<{count}I', view, offset)
-    return list(data), offset + byte_len
+    """Read `count` uint32 values as a flat array('I')."""
+    return _read_typed_array(view, offset, count, 'I')
 
 
 # =============================================================================
 # Object decoding (matches Blender decode_object_data exactly)
 # =============================================================================
 
+# type, id, version (u32), parent_id, material_id (i32), flags (u32)
+_OBJECT_HEADER = struct.Struct("<IIIiiI")
+_OBJECT_HEADER_SIZE = _OBJECT_HEADER.size
+_unpack_object_header = _OBJECT_HEADER.unpack_from
+
+
 def decode_object_data(view, offset):
     """
     Decode one object from binary data.
 
-    Returns tuple:
-        (object_type, object_id, version_id, parent_id, material_id, flags,
-         name, vertices, faces, normals, new_offset, groups, face_ids)
+    Returns (object_dict, new_offset). object_dict has the keys type, id,
+    version, parent_id, material_id, flags, name, vertices, faces, normals,
+    groups and face_ids.
     """
-    object_type, offset = _read_u32(view, offset)
-    object_id, offset = _read_u32(view, offset)
-    version_id, offset = _read_u32(view, offset)
-    parent_id, offset = _read_i32(view, offset)
-    material_id, offset = _read_i32(view, offset)
-    flags, offset = _read_u32(view, offset)
+    (object_type, object_id, version_id,
+     parent_id, material_id, flags) = _unpack_object_header(view, offset)
+    offset += _OBJECT_HEADER_SIZE
     name, offset = _read_string(view, offset)
 
     vertices = []
@@ -215,23 +250,22 @@ def decode_object_data(view, offset):
     elif object_type == ObjectType.GROUP:
         pass  # Groups have no geometry
 
-    return (object_type, object_id, version_id, parent_id, material_id, flags,
-            name, vertices, faces, normals, offset, groups, face_ids)
+    return {
+        'type': object_type, 'id': object_id, 'version': version_id,
+        'parent_id': parent_id, 'material_id': material_id, 'flags': flags,
+        'name': name, 'vertices': vertices, 'faces': faces,
+        'normals': normals, 'groups': groups, 'face_ids': face_ids,
+    }, offset
 
 
 def decode_objects(view, offset):
     """Decode multiple objects from a buffer (after skipping message sub-type)."""
     num_objects, offset = _read_u32(view, offset)
     objects = []
+    append = objects.append
     for _ in range(num_objects):
-        (obj_type, obj_id, ver, parent, mat, flags, name,
-         verts, faces, normals, offset, groups, face_ids) = decode_object_data(view, offset)
-        objects.append({
-            'type': obj_type, 'id': obj_id, 'version': ver,
-            'parent_id': parent, 'material_id': mat, 'flags': flags,
-            'name': name, 'vertices': verts, 'faces': faces,
-            'normals': normals, 'groups': groups, 'face_ids': face_ids,
-        })
+        obj, offset = decode_object_data(view, offset)
+        append(obj)
     return objects, offset
 
 
@@ -239,8 +273,32 @@ def decode_objects(view, offset):
 # Main message parser
 # =============================================================================
 
+class ParsedMessage:
+    """
+    Top-level result of parse_message(), handed to the main thread as
+    BridgeEvent.data.
+
+    objects holds the ADD entries of a transaction/list followed by its
+    UPDATE entries, or the items of a refacet response. version is the file
+    version; error is the non-200 code of a failed refacet.
+    """
+
+    __slots__ = ("type", "filename", "version", "objects", "delete", "error")
+
+    def __init__(self, type: MessageType, filename: str = "", version: int = 0,
+                 objects: Optional[List[Dict[str, Any]]] = None,
+                 delete: Optional[List[int]] = None,
+                 error: Optional[int] = None):
+        self.type     = type
+        self.filename = filename
+        self.version  = version
+        self.objects  = objects if objects is not None else []
+        self.delete   = delete if delete is not None else []
+        self.error    = error
+
+
 class MessageParser:
-    def parse_message(self, data: bytes) -> Optional[Dict[str, Any]]:
+    def parse_message(self, data: bytes) -> Optional[ParsedMessage]:
         if len(data) < 4:
             return None
 
@@ -248,39 +306,30 @@ class MessageParser:
         offset = 0
 
         msg_type_raw, offset = _read_u32(view, offset)
-        try:
-            message_type = MessageType(msg_type_raw)
-        except ValueError:
-            print(f"[Protocol] Unknown message type: {msg_type_raw}")
+        entry = self._DISPATCH.get(msg_type_raw)
+        if entry is None:
+            if msg_type_raw in _KNOWN_MESSAGE_TYPES:
+                print(f"[Protocol] Unhandled message type: {MessageType(msg_type_raw)}")
+            else:
+                print(f"[Protocol] Unknown message type: {msg_type_raw}")
             return None
 
-        if message_type == MessageType.TRANSACTION_1:
-            # Transaction has no message_id — goes straight to filename
-            return self._parse_transaction(view, offset, message_type)
+        message_type, parse = entry
+        return parse(self, view, offset, message_type)
 
-        elif message_type in (MessageType.LIST_ALL_1, MessageType.LIST_SOME_1,
-                              MessageType.LIST_VISIBLE_1):
-            message_id, offset = _read_u32(view, offset)
-            code, offset = _read_u32(view, offset)
-            if code != 200:
-                print(f"[Protocol] List failed with code: {code}")
-                return None
-            # LIST response wraps a transaction-like structure
-            return self._parse_transaction(view, offset, message_type)
-
-        elif message_type == MessageType.REFACET_SOME_1:
-            message_id, offset = _read_u32(view, offset)
-            return self._parse_refacet(view, offset, message_type)
-
-        elif message_type == MessageType.NEW_VERSION_1:
-            return self._parse_new_version(view, offset)
-
-        elif message_type == MessageType.NEW_FILE_1:
-            return self._parse_new_file(view, offset)
-
-        else:
-            print(f"[Protocol] Unhandled message type: {message_type}")
+    def _parse_list(self, view, offset, msg_type):
+        """Parse a LIST_* response: message id + status code, then a transaction."""
+        message_id, offset = _read_u32(view, offset)
+        code, offset = _read_u32(view, offset)
+        if code != 200:
+            print(f"[Protocol] List failed with code: {code}")
             return None
+        # LIST response wraps a transaction-like structure
+        return self._parse_transaction(view, offset, msg_type)
+
+    def _parse_refacet_some(self, view, offset, msg_type):
+        message_id, offset = _read_u32(view, offset)
+        return self._parse_refacet(view, offset, msg_type)
 
     def _parse_transaction(self, view, offset, msg_type):
         """Parse TRANSACTION or LIST response (same binary layout)."""
@@ -288,42 +337,37 @@ class MessageParser:
         version, offset = _read_u32(view, offset)
         num_messages, offset = _read_u32(view, offset)
 
-        transaction = {
-            'type': msg_type,
-            'filename': filename,
-            'version': version,
-            'delete': [],
-            'add': [],
-            'update': [],
-        }
+        transaction = ParsedMessage(msg_type, filename, version)
+        deleted = transaction.delete
+        added   = transaction.objects
+        updated = []
 
         for _ in range(num_messages):
             item_length, offset = _read_u32(view, offset)
             if item_length == 0:
                 continue
 
-            item_view = view[offset:offset + item_length]
-            item_type_raw = struct.unpack_from('<I', item_view, 0)[0]
-
-            try:
-                item_type = MessageType(item_type_raw)
-            except ValueError:
-                offset += item_length
-                continue
+            # Zero-copy slice bounded by item_length, so a malformed item
+            # raises struct.error instead of reading into the next one
+            item = view[offset:offset + item_length]
+            offset += item_length
+            # IntEnum members compare equal to their raw values; unknown
+            # item types simply match no branch and are skipped.
+            item_type = _unpack_u32(item, 0)[0]
 
             if item_type == MessageType.DELETE_1:
-                num_deleted = struct.unpack_from('<I', item_view, 4)[0]
-                for i in range(num_deleted):
-                    del_id = struct.unpack_from('<I', item_view, 8 + i * 4)[0]
-                    transaction['delete'].append(del_id)
+                num_deleted = _unpack_u32(item, 4)[0]
+                ids, _ = _read_uint_array(item, 8, num_deleted)
+                deleted.extend(ids)
 
             elif item_type in (MessageType.ADD_1, MessageType.UPDATE_1):
-                objects, _ = decode_objects(item_view, 4)
-                key = 'add' if item_type == MessageType.ADD_1 else 'update'
-                transaction[key].extend(objects)
-
-            offset += item_length
+                objects, _ = decode_objects(item, 4)
+                if item_type == MessageType.ADD_1:
+                    added.extend(objects)
+                else:
+                    updated.extend(objects)
 
+        added.extend(updated)
         return transaction
 
     def _parse_refacet(self, view, offset, msg_type):
@@ -331,7 +375,7 @@ class MessageParser:
         code, offset = _read_u32(view, offset)
         if code != 200:
             print(f"[Protocol] Refacet failed with code {code}")
-            return {'type': msg_type, 'error': code, 'refaceted_objects': []}
+            return ParsedMessage(msg_type, error=code)
 
         filename, offset = _read_string(view, offset)
         file_version, offset = _read_u32(view, offset)
@@ -372,24 +416,28 @@ class MessageParser:
                 'normals': normals, 'groups': groups, 'face_ids': face_ids,
             })
 
-        return {
-            'type': msg_type, 'filename': filename,
-            'file_version': file_version, 'refaceted_objects': items,
-        }
+        return ParsedMessage(msg_type, filename, file_version, items)
 
-    def _parse_new_version(self, view, offset):
+    def _parse_new_version(self, view, offset, msg_type):
         """Parse NEW_VERSION_1 message."""
         filename, offset = _read_string(view, offset)
         version, offset = _read_u32(view, offset)
-        return {
-            'type': MessageType.NEW_VERSION_1,
-            'filename': filename, 'version': version,
-        }
+        return ParsedMessage(msg_type, filename, version)
 
-    def _parse_new_file(self, view, offset):
+    def _parse_new_file(self, view, offset, msg_type):
         """Parse NEW_FILE_1 message."""
         filename, offset = _read_string(view, offset)
-        return {
-            'type': MessageType.NEW_FILE_1,
-            'filename': filename,
-        }
+        return ParsedMessage(msg_type, filename)
+
+    # Raw message type -> (enum member, parser). IntEnum members hash like
+    # their int values, so the raw u32 is looked up directly. TRANSACTION has
+    # no message_id and goes straight to the filename.
+    _DISPATCH = {
+        MessageType.TRANSACTION_1:  (MessageType.TRANSACTION_1,  _parse_transaction),
+        MessageType.LIST_ALL_1:     (MessageType.LIST_ALL_1,     _parse_list),
+        MessageType.LIST_SOME_1:    (MessageType.LIST_SOME_1,    _parse_list),
+        MessageType.LIST_VISIBLE_1: (MessageType.LIST_VISIBLE_1, _parse_list),
+        MessageType.REFACET_SOME_1: (MessageType.REFACET_SOME_1, _parse_refacet_some),
+        MessageType.NEW_VERSION_1:  (MessageType.NEW_VERSION_1,  _parse_new_version),
+        MessageType.NEW_FILE_1:     (MessageType.NEW_FILE_1,     _parse_new_file),
+    }
@@ -4,14 +4,22 @@ Threading bridge for communication between background WebSocket thread and C4D m
 Cinema 4D's API is not thread-safe, so all C4D operations must happen on the main thread.
 This module provides a thread-safe queue for passing parsed messages from the WebSocket
 client (running in a background thread) to the scene handler (called from main thread).
+The queue is a collections.deque: append() and popleft() are atomic in CPython, and the
+main thread only ever polls it, so no Queue lock/condition is needed.
 """
 
 import threading
-from queue import Queue, Empty
+import time
+import traceback
+import weakref
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any, Callable, Optional, Dict, List
 from dataclasses import dataclass
 from enum import Enum, auto
 
+from modules.latency import LatencyRing
+
 
 class EventType(Enum):
     CONNECTED = auto()
@@ -28,7 +36,7 @@ class EventType(Enum):
 @dataclass
 class BridgeEvent:
     event_type: EventType
-    data: Optional[Dict[str, Any]] = None
+    data: Any = None   # protocol.ParsedMessage for server messages
     error_message: Optional[str] = None
 
 
@@ -39,16 +47,27 @@ class ThreadingBridge:
     Usage:
         1. Background thread calls push_event() to queue events
         2. Main thread calls process_pending_events() from GeDialog.Timer()
+           or when woken by the wakeup hook (see set_wakeup())
         3. Registered callbacks are dispatched on the main thread
+
+    Blocking work that must not stall the main thread (network sends) can be
+    handed to submit(), which runs it on a single background worker.
     """
 
     def __init__(self, max_queue_size: int = 1000):
-        self._queue = Queue(maxsize=max_queue_size)
+        self._queue = deque()
+        self._max_queue_size = max_queue_size
         self._lock = threading.Lock()
         self._connected = False
         self._filename = None
         self._status_message = "Disconnected"
+        self._revision = 0
         self._callbacks: Dict[EventType, List[Callable]] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._wakeup: Optional[Callable[[], None]] = None
+        self._wake_pending = False
+        # Main-thread handler timings (bridge dispatch, dialog Command/tick)
+        self.latency = LatencyRing()
 
     @property
     def connected(self) -> bool:
@@ -57,8 +76,7 @@ class ThreadingBridge:
 
     @connected.setter
     def connected(self, value: bool):
-        with self._lock:
-            self._connected = value
+        self._set_state('_connected', value)
 
     @property
     def filename(self) -> Optional[str]:
@@ -67,8 +85,7 @@ class ThreadingBridge:
 
     @filename.setter
     def filename(self, value: Optional[str]):
-        with self._lock:
-            self._filename = value
+        self._set_state('_filename', value)
 
     @property
     def status_message(self) -> str:
@@ -77,48 +94,166 @@ class ThreadingBridge:
 
     @status_message.setter
     def status_message(self, value: str):
+        self._set_state('_status_message', value)
+
+    @property
+    def revision(self) -> int:
+        """Incremented whenever connected, filename or status_message changes."""
         with self._lock:
-            self._status_message = value
+            return self._revision
 
-    def push_event(self, event: BridgeEvent) -> bool:
+    def snapshot(self):
+        """(connected, status_message, filename) read under one lock acquisition."""
+        with self._lock:
+            return self._connected, self._status_message, self._filename
+
+    def _set_state(self, attr: str, value):
+        with self._lock:
+            if getattr(self, attr) == value:
+                return
+            setattr(self, attr, value)
+            self._revision += 1
+        self._notify()
+
+    # =========================================================================
+    # Main-thread wakeup
+    # =========================================================================
+
+    def set_wakeup(self, fn: Optional[Callable[[], None]]):
+        """
+        Install a hook that asks the main thread to pump the bridge, e.g.
+        c4d.SpecialEventAdd(). It may be called from any thread and fires at
+        most once until the main thread calls consume_wakeup().
+        """
+        self._wakeup = fn
+
+    def consume_wakeup(self):
+        """Called by the main thread before pumping; re-arms the wakeup hook."""
+        with self._lock:
+            self._wake_pending = False
+
+    def _notify(self):
+        fn = self._wakeup
+        if fn is None:
+            return
+        with self._lock:
+            if self._wake_pending:
+                return
+            self._wake_pending = True
         try:
-            self._queue.put_nowait(event)
-            return True
-        except Exception:
+            fn()
+        except Exception as e:
+            print(f"[Bridge] Wakeup error: {e}")
+
+    def push_event(self, event: BridgeEvent) -> bool:
+        # Size check and append are not one atomic step, so concurrent
+        # producers may overshoot the bound by a few events; that's fine.
+        if len(self._queue) >= self._max_queue_size:
             return False
+        self._queue.append(event)
+        self._notify()
+        return True
+
+    def push_events(self, events: List[BridgeEvent]) -> int:
+        """Queue several events with a single wakeup; returns how many fit."""
+        room = self._max_queue_size - len(self._queue)
+        if room <= 0:
+            return 0
+        if len(events) > room:
+            events = events[:room]
+        self._queue.extend(events)
+        self._notify()
+        return len(events)
+
+    def has_pending(self) -> bool:
+        """Cheap check so the main thread can skip an empty drain."""
+        return bool(self._queue)
 
     def register_callback(self, event_type: EventType, callback: Callable):
-        if event_type not in self._callbacks:
-            self._callbacks[event_type] = []
-        self._callbacks[event_type].append(callback)
+        """
+        Register a main-thread callback. A weakref.WeakMethod may be passed so
+        the bridge does not keep its owner alive; it is dropped once dead.
+        """
+        self.register_many(((event_type, callback),))
+
+    def register_many(self, pairs):
+        """Register (event_type, callback) pairs under a single lock acquisition."""
+        with self._lock:
+            callbacks = self._callbacks
+            for event_type, callback in pairs:
+                callbacks.setdefault(event_type, []).append(callback)
 
     def dispatch_event(self, event: BridgeEvent):
-        if event.event_type in self._callbacks:
-            for callback in self._callbacks[event.event_type]:
-                try:
-                    callback(event)
-                except Exception as e:
-                    print(f"[Bridge] Callback error for {event.event_type}: {e}")
-                    import traceback
-                    traceback.print_exc()
+        callbacks = self._callbacks.get(event.event_type)
+        if not callbacks:
+            return
+        t0 = time.perf_counter_ns()
+        dead = False
+        for callback in tuple(callbacks):
+            if isinstance(callback, weakref.WeakMethod):
+                fn = callback()
+                if fn is None:
+                    dead = True
+                    continue
+            else:
+                fn = callback
+            try:
+                fn(event)
+            except Exception as e:
+                print(f"[Bridge] Callback error for {event.event_type}: {e}")
+                traceback.print_exc()
+        if dead:
+            callbacks[:] = [cb for cb in callbacks
+                            if not (isinstance(cb, weakref.WeakMethod) and cb() is None)]
+        self.latency.push(event.event_type.name, time.perf_counter_ns() - t0)
 
     def process_pending_events(self, max_events: int = 10) -> int:
+        popleft = self._queue.popleft
         count = 0
         while count < max_events:
             try:
-                event = self._queue.get_nowait()
-                self.dispatch_event(event)
-                count += 1
-            except Empty:
+                event = popleft()
+            except IndexError:
                 break
+            self.dispatch_event(event)
+            count += 1
         return count
 
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        """
+        Run fn(*args, **kwargs) on the bridge worker thread.
+
+        Jobs run one at a time in submission order. fn must not touch the C4D
+        API; results go back to the main thread through push_event(). If fn
+        raises, a STATUS_UPDATE event carrying the error is pushed so the
+        dialog can clear its busy state.
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="PlasticityBridge")
+            executor = self._executor
+        return executor.submit(self._run_job, fn, args, kwargs)
+
+    def _run_job(self, fn: Callable, args, kwargs):
+        try:
+            return fn(*args, **kwargs)
+        except Exception as e:
+            print(f"[Bridge] Worker error in {getattr(fn, '__name__', fn)}: {e}")
+            traceback.print_exc()
+            self.push_event(BridgeEvent(
+                event_type=EventType.STATUS_UPDATE, error_message=str(e)
+            ))
+
+    def shutdown(self):
+        """Stop the worker thread; queued jobs that have not started are dropped."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor:
+            executor.shutdown(wait=False, cancel_futures=True)
+
     def clear_queue(self):
-        while True:
-            try:
-                self._queue.get_nowait()
-            except Empty:
-                break
+        self._queue.clear()
 
 
 class StatusReporter: